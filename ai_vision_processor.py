@@ -6,8 +6,10 @@ Combines OCR with AI-powered image description generation
 
 import os
 import io
+import logging
 import warnings
 import hashlib
+import importlib.util
 from pathlib import Path
 
 # Suppress transformer warnings
@@ -23,22 +25,31 @@ except ImportError:
 
 try:
     import pytesseract
+    from pytesseract import Output
     TESSERACT_AVAILABLE = True
 except ImportError:
     TESSERACT_AVAILABLE = False
     print("Warning: pytesseract not installed. OCR will be disabled.")
 
-# Try to import AI vision models
-try:
-    from transformers import BlipProcessor, BlipForConditionalGeneration
-    import torch
-    AI_VISION_AVAILABLE = True
+# Check for the AI vision models without importing them: transformers and torch
+# take seconds and hundreds of MB to load, so they are only imported once a
+# processor actually loads its models
+AI_VISION_AVAILABLE = (importlib.util.find_spec("transformers") is not None and
+                       importlib.util.find_spec("torch") is not None)
+if AI_VISION_AVAILABLE:
     print("✓ AI Vision models available (BLIP)")
-except ImportError:
-    AI_VISION_AVAILABLE = False
+else:
     print("Note: transformers not installed. Install for AI image descriptions:")
     print("  pip3 install transformers torch")
 
+logger = logging.getLogger(__name__)
+
+# Words Tesseract is less confident about than this (0-100) are dropped from OCR text
+OCR_MIN_WORD_CONFIDENCE = 50
+
+# Block OCR whose mean word confidence is above this is accepted without a single-line retry
+OCR_ACCEPT_CONFIDENCE = 60
+
 class AIVisionProcessor:
     """Enhanced image processor with AI-powered description generation"""
     
@@ -55,6 +66,8 @@ class AIVisionProcessor:
         self.pil_available = PIL_AVAILABLE
         self.ai_vision_available = AI_VISION_AVAILABLE and enable_ai
         self.current_output_dir = None
+        self._images_folder = None  # Image folder of the current document
+        self._image_folder_path = None  # Its full path on disk
         
         # Image deduplication system
         self.image_hashes = {}  # hash -> (filename, alt_text, ai_description, ocr_text)
@@ -89,6 +102,8 @@ class AIVisionProcessor:
         """Initialize AI vision models"""
         try:
             print("Loading AI vision models... (this may take a moment)")
+            from transformers import BlipProcessor, BlipForConditionalGeneration
+            import torch
             
             if model_size == 'large':
                 model_name = "Salesforce/blip-image-captioning-large"
@@ -124,6 +139,9 @@ class AIVisionProcessor:
             os.makedirs(image_folder_path)
             print(f"✓ Created image folder: {image_folder_path}")
         
+        self._images_folder = image_folder_name
+        self._image_folder_path = image_folder_path
+        
         return image_folder_name
     
     def reset_image_cache(self):
@@ -148,7 +166,7 @@ class AIVisionProcessor:
                 cached_data = self.image_hashes[image_hash]
                 cached_filename, cached_alt_text, cached_ai_desc, cached_ocr_text = cached_data
                 
-                print(f"✓ Duplicate image detected, reusing: {cached_filename}")
+                logger.debug("Duplicate image detected, reusing: %s", cached_filename)
                 
                 # Update alt text with new position info but keep AI description
                 updated_alt_text = self._update_alt_text_for_duplicate(
@@ -172,14 +190,17 @@ class AIVisionProcessor:
             if self.current_output_dir is None:
                 raise ValueError("No output directory set. Call create_image_folder first.")
             
-            image_folder_path = os.path.join(self.current_output_dir, images_folder)
-            if not os.path.exists(image_folder_path):
-                os.makedirs(image_folder_path)
+            # create_image_folder already made the current document's folder
+            if images_folder == self._images_folder:
+                image_folder_path = self._image_folder_path
+            else:
+                image_folder_path = os.path.join(self.current_output_dir, images_folder)
+                os.makedirs(image_folder_path, exist_ok=True)
             
             image_path = os.path.join(image_folder_path, image_filename)
             with open(image_path, 'wb') as f:
                 f.write(image_bytes)
-            print(f"✓ Saved new unique image: {image_path}")
+            logger.debug("Saved new unique image: %s", image_path)
             
             # Generate smart alt text and extract components for caching
             alt_text = self._generate_smart_alt_text(
@@ -205,6 +226,23 @@ class AIVisionProcessor:
             image_filename = f"image_{image_number}.{original_format.lower()}"
             return f"![{alt_text}]({images_folder}/{image_filename})"
     
+    def process_images_batch(self, jobs):
+        """
+        Process several images of one document in order
+        
+        The AI model is loaded once in this process, so images are handled
+        one after another rather than in worker processes.
+        
+        Args:
+            jobs: List of dicts holding the keyword arguments of process_image
+            
+        Returns:
+            List of markdown placeholders in the same order as jobs
+        """
+        placeholders = [self.process_image(**job) for job in jobs]
+        print(f"✓ Saved {self.image_counter} unique images to {self._image_folder_path}")
+        return placeholders
+    
     def _generate_smart_alt_text(self, image, image_number, position_info, 
                                 existing_alt='', existing_caption=''):
         """Generate intelligent alt text using OCR + AI"""
@@ -233,27 +271,22 @@ class AIVisionProcessor:
         
         try:
             # Enhance image for better OCR
-            enhanced_image = self._enhance_image_for_ocr(image.copy())
-            
-            # Try multiple OCR configurations
-            ocr_configs = [
-                '--psm 3',  # Fully automatic page segmentation
-                '--psm 6',  # Single uniform block
-                '--psm 7',  # Single text line
-            ]
-            
-            for config in ocr_configs:
-                try:
-                    ocr_text = pytesseract.image_to_string(enhanced_image, config=config).strip()
-                    ocr_text = ' '.join(ocr_text.split())  # Clean whitespace
-                    
-                    if ocr_text and len(ocr_text) > 3:
-                        # Limit length
-                        if len(ocr_text) > 150:
-                            ocr_text = ocr_text[:147] + "..."
-                        return ocr_text
-                except:
-                    continue
+            enhanced_image = self._enhance_image_for_ocr(image)
+            
+            # Single Tesseract run on the LSTM engine, treating the image as one text block
+            ocr_text, confidence = self._ocr_words(enhanced_image, '--psm 6 --oem 1')
+            
+            # Tesseract's own confidence decides whether to retry once as a single line
+            if confidence <= OCR_ACCEPT_CONFIDENCE:
+                line_text, line_confidence = self._ocr_words(enhanced_image, '--psm 7 --oem 1')
+                if line_confidence > confidence:
+                    ocr_text = line_text
+            
+            if len(ocr_text) > 3:
+                # Limit length
+                if len(ocr_text) > 150:
+                    ocr_text = ocr_text[:147] + "..."
+                return ocr_text
             
             return ""
             
@@ -261,6 +294,31 @@ class AIVisionProcessor:
             print(f"Warning: OCR failed: {e}")
             return ""
     
+    def _ocr_words(self, image, config):
+        """
+        Run Tesseract once and join the words recognized with reasonable confidence
+        
+        Returns:
+            Tuple of (text, mean confidence of all recognized words, 0-100)
+        """
+        try:
+            data = pytesseract.image_to_data(image, config=config, output_type=Output.DICT)
+        except Exception:
+            return "", 0.0
+        
+        word_confidences = [
+            (text, float(conf)) for text, conf in zip(data['text'], data['conf'])
+            if text.strip() and float(conf) >= 0
+        ]
+        if not word_confidences:
+            return "", 0.0
+        
+        words = [
+            text for text, conf in word_confidences if conf > OCR_MIN_WORD_CONFIDENCE
+        ]
+        mean_confidence = sum(conf for _, conf in word_confidences) / len(word_confidences)
+        return ' '.join(words), mean_confidence
+    
     def _generate_ai_description(self, image):
         """Generate AI-powered image description"""
         if not self.ai_vision_available:
@@ -278,7 +336,9 @@ class AIVisionProcessor:
             device = next(self.ai_model.parameters()).device
             inputs = {k: v.to(device) for k, v in inputs.items()}
             
-            # Generate description with improved parameters
+            # Generate description with improved parameters (torch is already
+            # loaded by _initialize_ai_models, so this import is a lookup)
+            import torch
             with torch.no_grad():
                 out = self.ai_model.generate(
                     **inputs, 
@@ -377,15 +437,15 @@ class AIVisionProcessor:
                 image = image.convert('L')
             
             # Enhance for OCR
-            from PIL import ImageEnhance
+            from PIL import ImageEnhance, ImageFilter
             
             # Increase contrast
             enhancer = ImageEnhance.Contrast(image)
             image = enhancer.enhance(1.5)
             
-            # Increase sharpness
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(2.0)
+            # Sharpen with an unsharp mask; Pillow's filter kernels are SIMD-accelerated
+            # under pillow-simd
+            image = image.filter(ImageFilter.UnsharpMask(radius=1, percent=100, threshold=3))
             
             return image
             
@@ -393,9 +453,16 @@ class AIVisionProcessor:
             print(f"Warning: Could not enhance image for OCR: {e}")
             return image
     
-    def process_image_file(self, image_file_path, output_file=None, enable_ai=None):
-        """Process a standalone image file with AI description"""
-        if not os.path.exists(image_file_path):
+    def process_image_file(self, image_file_path, output_file=None, enable_ai=None, image_bytes=None):
+        """Process a standalone image file with AI description
+        
+        Args:
+            image_file_path: Path of the image file
+            output_file: Markdown file to write (defaults to the image path with .md)
+            enable_ai: Override the processor's AI setting for this file
+            image_bytes: The file's contents, if the caller already read them
+        """
+        if image_bytes is None and not os.path.exists(image_file_path):
             raise FileNotFoundError(f"Image file not found: {image_file_path}")
         
         if not self.pil_available:
@@ -407,8 +474,11 @@ class AIVisionProcessor:
             self.ai_vision_available = enable_ai and AI_VISION_AVAILABLE
         
         try:
-            # Open image
-            image = Image.open(image_file_path)
+            # Read the image bytes once; the decoder works from memory
+            if image_bytes is None:
+                with open(image_file_path, 'rb') as f:
+                    image_bytes = f.read()
+            image = Image.open(io.BytesIO(image_bytes))
             
             # Generate output filename
             if output_file is None:
@@ -423,10 +493,6 @@ class AIVisionProcessor:
             # Create image folder
             images_folder = self.create_image_folder(output_file)
             
-            # Read image bytes
-            with open(image_file_path, 'rb') as f:
-                image_bytes = f.read()
-            
             # Get original format
             original_format = Path(image_file_path).suffix[1:]
             
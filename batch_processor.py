@@ -4,9 +4,12 @@ Batch processor for MarkdownMagic - handles multiple file conversions with size
 """
 
 import os
+import stat
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 @dataclass
 class BatchResult:
@@ -16,20 +19,81 @@ class BatchResult:
     total_size_mb: float
     total_files: int
     skipped_files: List[Tuple[str, str]]  # (filename, reason)
+    converted_files: Dict[str, str] = field(default_factory=dict)  # input path -> output path
+
+@dataclass
+class ConverterConfig:
+    """How to build a converter, for callers that shouldn't build one up front
+    
+    A parallel batch only needs this in the parent process; each worker builds
+    its own converter from it.
+    """
+    converter_class: type
+    tesseract_path: Optional[str] = None
+    enable_ai: bool = True
+    
+    def build(self):
+        """Create a converter from these settings"""
+        return self.converter_class(self.tesseract_path, enable_ai=self.enable_ai)
+
+# Converter owned by each worker process when a batch runs in parallel
+_worker_converter = None
+
+def _init_worker(converter_class, tesseract_path, enable_ai):
+    """Create one converter per worker process (converters hold per-document state)"""
+    global _worker_converter
+    _worker_converter = converter_class(tesseract_path, enable_ai=enable_ai)
+
+def _convert_in_worker(file_path: str, output_path: str) -> str:
+    """Convert a single file using the worker process's converter"""
+    return _worker_converter.convert_to_markdown(file_path, output_path)
+
+def create_worker_pool(max_workers: int, converter, mp_context=None) -> ProcessPoolExecutor:
+    """
+    Start a process pool whose workers each hold their own converter
+    
+    Args:
+        max_workers: Number of worker processes
+        converter: Converter instance or ConverterConfig describing the one to build
+        mp_context: Optional multiprocessing context (e.g. spawn, for threaded servers)
+        
+    Returns:
+        ProcessPoolExecutor: Pool to pass to BatchProcessor(executor=...)
+    """
+    if isinstance(converter, ConverterConfig):
+        initargs = (converter.converter_class, converter.tesseract_path, converter.enable_ai)
+    else:
+        initargs = (
+            type(converter),
+            getattr(converter, 'tesseract_path', None),
+            getattr(converter, 'enable_ai', True)
+        )
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                               initializer=_init_worker, initargs=initargs)
 
 class BatchProcessor:
     """
     Handles batch processing of multiple documents with size and format validation
     """
     
-    def __init__(self, max_batch_size_mb: float = 250.0):
+    def __init__(self, max_batch_size_mb: float = 250.0, max_workers: Optional[int] = 1,
+                 executor: Optional[ProcessPoolExecutor] = None, mp_context=None):
         """
         Initialize BatchProcessor
         
         Args:
             max_batch_size_mb: Maximum total file size for a batch in MB
+            max_workers: Number of worker processes for converting files in parallel
+                (1 converts serially in-process, None uses one per CPU core)
+            executor: Long-lived pool from create_worker_pool to convert on, instead
+                of starting a pool for each batch (max_workers is then ignored)
+            mp_context: Optional multiprocessing context for the pool started per
+                batch (e.g. spawn, when the caller runs other threads)
         """
         self.max_batch_size_mb = max_batch_size_mb
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.executor = executor
+        self.mp_context = mp_context
         self.supported_extensions = {
             '.txt', '.pdf', '.docx', '.odt', '.rtf', '.html', '.htm', '.xlsx', '.xls',
             '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'
@@ -53,13 +117,15 @@ class BatchProcessor:
         for file_path in file_paths:
             file_path = str(file_path).strip()
             
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # One stat answers existence, type and size
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 invalid_files.append((file_path, "File not found"))
                 continue
             
             # Check if it's a file (not directory)
-            if not os.path.isfile(file_path):
+            if not stat.S_ISREG(file_stat.st_mode):
                 invalid_files.append((file_path, "Not a file"))
                 continue
             
@@ -69,22 +135,15 @@ class BatchProcessor:
                 invalid_files.append((file_path, f"Unsupported format: {file_ext}"))
                 continue
             
-            # Check file size
-            try:
-                file_size = os.path.getsize(file_path)
-                
-                # Check if adding this file would exceed the batch limit
-                if (total_size_bytes + file_size) > (self.max_batch_size_mb * 1024 * 1024):
-                    invalid_files.append((file_path, f"Would exceed {self.max_batch_size_mb}MB batch limit"))
-                    continue
-                
-                # File is valid
-                valid_files.append(file_path)
-                total_size_bytes += file_size
-                
-            except OSError as e:
-                invalid_files.append((file_path, f"Cannot read file size: {e}"))
+            # Check if adding this file would exceed the batch limit
+            file_size = file_stat.st_size
+            if (total_size_bytes + file_size) > (self.max_batch_size_mb * 1024 * 1024):
+                invalid_files.append((file_path, f"Would exceed {self.max_batch_size_mb}MB batch limit"))
                 continue
+            
+            # File is valid
+            valid_files.append(file_path)
+            total_size_bytes += file_size
         
         total_size_mb = total_size_bytes / (1024 * 1024)
         return valid_files, invalid_files, total_size_mb
@@ -97,7 +156,9 @@ class BatchProcessor:
         Args:
             file_paths: List of file paths to convert
             output_folder: Destination folder for converted files
-            converter: DocumentConverter instance
+            converter: DocumentConverter instance, or a ConverterConfig to build one
+                only where it is needed (once here when serial, once per worker
+                process when parallel)
             progress_callback: Optional callback function for progress updates
             
         Returns:
@@ -111,25 +172,75 @@ class BatchProcessor:
         
         successful_files = []
         failed_files = []
+        converted_files = {}
         skipped_files = invalid_files.copy()  # Files that were skipped during validation
         
         total_files = len(valid_files)
         
-        # Process each valid file
-        for i, file_path in enumerate(valid_files):
+        # Reserve output paths up front so parallel workers never race on names
+        output_paths = self._assign_output_paths(valid_files, output_folder)
+        
+        # A shared pool takes even single files, so the caller never needs a converter
+        if self.executor is not None or (self.max_workers > 1 and total_files > 1):
+            self._process_parallel(valid_files, output_paths, converter, progress_callback,
+                                   successful_files, failed_files, converted_files)
+        else:
+            self._process_serial(valid_files, output_paths, converter, progress_callback,
+                                 successful_files, failed_files, converted_files)
+        
+        return BatchResult(
+            successful_files=successful_files,
+            failed_files=failed_files,
+            total_size_mb=total_size_mb,
+            total_files=len(file_paths),
+            skipped_files=skipped_files,
+            converted_files=converted_files
+        )
+    
+    def _assign_output_paths(self, file_paths: List[str], output_folder: str) -> List[str]:
+        """
+        Pick a unique Markdown output path for each input file
+        
+        Args:
+            file_paths: Input files, in processing order
+            output_folder: Destination folder for converted files
+            
+        Returns:
+            List[str]: Output path for each input file
+        """
+        reserved = set()
+        output_paths = []
+        
+        for file_path in file_paths:
+            # Generate output filename
+            input_file = Path(file_path)
+            output_filename = f"{input_file.stem}.md"
+            output_path = os.path.join(output_folder, output_filename)
+            
+            # Handle filename conflicts (existing files and earlier files in this batch)
+            counter = 1
+            while output_path in reserved or os.path.exists(output_path):
+                output_filename = f"{input_file.stem}_{counter}.md"
+                output_path = os.path.join(output_folder, output_filename)
+                counter += 1
+            
+            reserved.add(output_path)
+            output_paths.append(output_path)
+        
+        return output_paths
+    
+    def _process_serial(self, file_paths: List[str], output_paths: List[str], converter,
+                        progress_callback: Optional[callable],
+                        successful_files: List[str], failed_files: List[Tuple[str, str]],
+                        converted_files: Dict[str, str]) -> None:
+        """Convert files one at a time with the given converter"""
+        total_files = len(file_paths)
+        if total_files and isinstance(converter, ConverterConfig):
+            converter = converter.build()
+        
+        for i, (file_path, output_path) in enumerate(zip(file_paths, output_paths)):
             try:
-                # Generate output filename
                 input_file = Path(file_path)
-                output_filename = f"{input_file.stem}.md"
-                output_path = os.path.join(output_folder, output_filename)
-                
-                # Handle filename conflicts
-                counter = 1
-                original_output_path = output_path
-                while os.path.exists(output_path):
-                    output_filename = f"{input_file.stem}_{counter}.md"
-                    output_path = os.path.join(output_folder, output_filename)
-                    counter += 1
                 
                 # Call progress callback for file start if provided  
                 if progress_callback:
@@ -141,6 +252,7 @@ class BatchProcessor:
                 
                 result_path = converter.convert_to_markdown(file_path, output_path)
                 successful_files.append(result_path)
+                converted_files[file_path] = result_path
                 
                 # Report completion
                 if progress_callback:
@@ -153,14 +265,64 @@ class BatchProcessor:
                 if progress_callback:
                     progress_callback(i + 1, total_files, file_path, "failed") 
                 print(f"✗ Failed: {Path(file_path).name} - {e}")
+    
+    def _process_parallel(self, file_paths: List[str], output_paths: List[str], converter,
+                          progress_callback: Optional[callable],
+                          successful_files: List[str], failed_files: List[Tuple[str, str]],
+                          converted_files: Dict[str, str]) -> None:
+        """Convert files concurrently in a process pool, one converter per worker"""
+        if self.executor is not None:
+            # The shared pool's workers were given their converters when it started
+            self._run_on_pool(self.executor, file_paths, output_paths, progress_callback,
+                              successful_files, failed_files, converted_files)
+            return
         
-        return BatchResult(
-            successful_files=successful_files,
-            failed_files=failed_files,
-            total_size_mb=total_size_mb,
-            total_files=len(file_paths),
-            skipped_files=skipped_files
-        )
+        max_workers = min(self.max_workers, len(file_paths))
+        with create_worker_pool(max_workers, converter, self.mp_context) as executor:
+            self._run_on_pool(executor, file_paths, output_paths, progress_callback,
+                              successful_files, failed_files, converted_files)
+    
+    def _run_on_pool(self, executor: ProcessPoolExecutor, file_paths: List[str],
+                     output_paths: List[str], progress_callback: Optional[callable],
+                     successful_files: List[str], failed_files: List[Tuple[str, str]],
+                     converted_files: Dict[str, str]) -> None:
+        """
+        Submit every file to executor and collect the results as they finish
+        
+        A broken shared pool (self.executor) is raised rather than recorded as
+        failed files, so its owner can replace it before the next batch.
+        """
+        total_files = len(file_paths)
+        futures = {}
+        for file_path, output_path in zip(file_paths, output_paths):
+            futures[executor.submit(_convert_in_worker, file_path, output_path)] = file_path
+        
+        # Report progress in completion order
+        for completed, future in enumerate(as_completed(futures), start=1):
+            file_path = futures[future]
+            try:
+                result_path = future.result()
+                successful_files.append(result_path)
+                converted_files[file_path] = result_path
+                if progress_callback:
+                    progress_callback(completed, total_files, file_path, "completed")
+                print(f"✓ Converted: {Path(file_path).name} → {Path(result_path).name}")
+                
+            except BrokenProcessPool as e:
+                # A worker died. A pool owned by this batch goes away with it, but a
+                # shared one would fail every later batch
+                if executor is self.executor:
+                    raise
+                failed_files.append((file_path, str(e)))
+                if progress_callback:
+                    progress_callback(completed, total_files, file_path, "failed")
+                print(f"✗ Failed: {Path(file_path).name} - {e}")
+                
+            except Exception as e:
+                failed_files.append((file_path, str(e)))
+                if progress_callback:
+                    progress_callback(completed, total_files, file_path, "failed")
+                print(f"✗ Failed: {Path(file_path).name} - {e}")
     
     def collect_files_from_folder(self, folder_path: str, recursive: bool = False) -> List[str]:
         """
@@ -162,6 +162,51 @@ class DocumentConverter:
                 common_headers = self._find_common_lines(potential_headers) if len(potential_headers) > 1 else []
                 common_footers = self._find_common_lines(potential_footers) if len(potential_footers) > 1 else []
                 
+                # Extract every page's images up front so they are processed in one batch
+                page_images = []  # Per page: image jobs, or placeholders for failed extractions
+                image_jobs = []
+                for page_num in range(total_pages):
+                    page_entries = []
+                    try:
+                        image_list = pdf[page_num].get_images()
+                        for img_index, img in enumerate(image_list):
+                            try:
+                                # Extract image
+                                xref = img[0]
+                                base_image = pdf.extract_image(xref)
+                                image_bytes = base_image["image"]
+                                
+                                image_count += 1
+                                job = {
+                                    'image_bytes': image_bytes,
+                                    'image_number': image_count,
+                                    'images_folder': images_folder,
+                                    'position_info': f"pg{page_num + 1}",
+                                }
+                                image_jobs.append(job)
+                                page_entries.append(job)
+                                
+                            except Exception as e:
+                                print(f"  ⚠ Failed to extract image {img_index + 1}: {e}")
+                                # Create a placeholder anyway
+                                placeholder = f"![Image {image_count + 1}, pg{page_num + 1} - Could not extract image]({images_folder}/image_{image_count + 1}.png)"
+                                page_entries.append(placeholder)
+                                image_count += 1
+                    
+                    except Exception as e:
+                        print(f"  ⚠ Error processing images on page {page_num + 1}: {e}")
+                    
+                    page_images.append(page_entries)
+                
+                # Save all images and run their OCR in one batch, then slot the
+                # resulting placeholders back into their pages
+                if image_jobs:
+                    placeholders = iter(self.image_processor.process_images_batch(image_jobs))
+                    page_images = [
+                        [next(placeholders) if isinstance(entry, dict) else entry for entry in page_entries]
+                        for page_entries in page_images
+                    ]
+                
                 # Prepare to extract text with structure
                 with open(output_file, 'w', encoding='utf-8') as f:
                     # Add YAML frontmatter
@@ -178,43 +223,13 @@ class DocumentConverter:
                     for page_num in range(total_pages):
                         print(f"Processing page {page_num + 1}...")
                         
-                        # Get the page
-                        page = pdf[page_num]
-                        
                         # Use pre-collected text and clean it
                         text = page_texts[page_num]
                         cleaned_text = self._remove_headers_footers(text, common_headers, common_footers)
                         
-                        # Extract images from this page
-                        try:
-                            image_list = page.get_images()
-                            for img_index, img in enumerate(image_list):
-                                try:
-                                    # Extract image
-                                    xref = img[0]
-                                    base_image = pdf.extract_image(xref)
-                                    image_bytes = base_image["image"]
-                                    
-                                    image_count += 1
-                                    
-                                    # Process image with OCR
-                                    page_info = f"pg{page_num + 1}"
-                                    markdown_placeholder = self.image_processor.process_image(
-                                        image_bytes, image_count, images_folder, page_info
-                                    )
-                                    
-                                    # Add to markdown
-                                    f.write(f"{markdown_placeholder}\n\n")
-                                    
-                                except Exception as e:
-                                    print(f"  ⚠ Failed to extract image {img_index + 1}: {e}")
-                                    # Create a placeholder anyway
-                                    placeholder = f"![Image {image_count + 1}, pg{page_num + 1} - Could not extract image]({images_folder}/image_{image_count + 1}.png)"
-                                    f.write(f"{placeholder}\n\n")
-                                    image_count += 1
-                        
-                        except Exception as e:
-                            print(f"  ⚠ Error processing images on page {page_num + 1}: {e}")
+                        # Add this page's images
+                        for markdown_placeholder in page_images[page_num]:
+                            f.write(f"{markdown_placeholder}\n\n")
                         
                         # Add cleaned page text with Markdown enhancement
                         if cleaned_text.strip():
@@ -297,6 +312,7 @@ class DocumentConverter:
                     # Don't add redundant title - let document content provide its own headings
                     
                     # First pass: extract images from document relationships
+                    image_jobs = []
                     try:
                         # Extract images from document relationships
                         if hasattr(doc, 'part') and hasattr(doc.part, 'rels'):
@@ -308,16 +324,21 @@ class DocumentConverter:
                                         image_bytes = image_part.blob
                                         
                                         image_count += 1
-                                        
-                                        # Process image with OCR
-                                        markdown_placeholder = self.image_processor.process_image(
-                                            image_bytes, image_count, images_folder, f"pos{image_count}"
-                                        )
+                                        image_jobs.append({
+                                            'image_bytes': image_bytes,
+                                            'image_number': image_count,
+                                            'images_folder': images_folder,
+                                            'position_info': f"pos{image_count}",
+                                        })
                                         
                                         print(f"Extracted image {image_count} from DOCX")
                                         
                                     except Exception as e:
                                         print(f"Warning: Could not extract image {rel_id}: {e}")
+                        
+                        # Save the images and run their OCR in one batch
+                        if image_jobs:
+                            self.image_processor.process_images_batch(image_jobs)
                     except Exception as e:
                         print(f"Warning: Could not extract images from DOCX: {e}")
                     
@@ -4,23 +4,309 @@ Markdown Magic - Flask Web Application
 Web interface for document conversion that can be hosted on your website
 """
 
-from flask import Flask, request, render_template_string, send_file, jsonify, redirect, url_for
+from flask import Flask, Response, request, send_file, jsonify, redirect, url_for
 import tempfile
 import os
 import zipfile
-import io
+import shutil
+import time
+import heapq
+import hashlib
+import gzip
+import json
+import threading
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 import uuid
+from collections import OrderedDict
 from werkzeug.utils import secure_filename
+from werkzeug.wsgi import LimitedStream
 from document_converter import DocumentConverter
-from batch_processor import BatchProcessor
+from batch_processor import BatchProcessor, BatchResult, ConverterConfig, create_worker_pool
+
+try:
+    from ai_vision_processor import AI_VISION_AVAILABLE
+except ImportError:
+    AI_VISION_AVAILABLE = False
+
+# Optional C-accelerated streaming multipart parser (pip install streaming-form-data)
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import BaseTarget, ValueTarget
+    STREAMING_FORM_DATA_AVAILABLE = True
+except ImportError:
+    STREAMING_FORM_DATA_AVAILABLE = False
+
+# Optional Brotli compression for the index page (pip install brotli)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+class GzipRequestMiddleware:
+    """WSGI middleware that transparently decompresses gzip-encoded request bodies"""
+    
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        if environ.get('HTTP_CONTENT_ENCODING', '').strip().lower() == 'gzip':
+            compressed = environ['wsgi.input']
+            content_length = environ.get('CONTENT_LENGTH')
+            if content_length and not environ.get('wsgi.input_terminated'):
+                # Don't let the decompressor read past the body on a kept-alive socket
+                compressed = LimitedStream(compressed, int(content_length))
+            environ['wsgi.input'] = gzip.GzipFile(fileobj=compressed, mode='rb')
+            # The decompressed length is unknown: read to EOF, still capped by MAX_CONTENT_LENGTH
+            environ.pop('CONTENT_LENGTH', None)
+            environ.pop('HTTP_CONTENT_ENCODING', None)
+            environ['wsgi.input_terminated'] = True
+        
+        return self.wsgi_app(environ, start_response)
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 app.secret_key = 'markdown_magic_secret_key_change_in_production'
+app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
+
+# Store conversion results temporarily, oldest first
+conversion_results = OrderedDict()
+
+# Bounds on stored sessions; the oldest are evicted when either is exceeded
+MAX_SESSIONS = int(os.environ.get('MARKDOWN_MAGIC_MAX_SESSIONS', 100))
+MAX_SESSION_BYTES = int(os.environ.get('MARKDOWN_MAGIC_MAX_SESSION_BYTES', 2 * 1024 * 1024 * 1024))
+_results_total_bytes = 0
+
+# Sessions expire after 1 hour; expiries are kept in a min-heap of (expires_at, session_id)
+SESSION_TTL_SECONDS = 3600
+_expiry_heap = []
+_results_lock = threading.Lock()
+_cleanup_thread = None
+
+# Name of the cached "download all" archive inside each session's output directory
+ARCHIVE_NAME = 'markdown_magic_conversion.zip'
+
+# Worker processes shared by all requests for converting files in parallel. Each
+# worker loads its own copy of the AI vision models, so when they are installed
+# the default is capped at AI_BATCH_MAX_WORKERS
+AI_BATCH_MAX_WORKERS = 2
+_default_batch_workers = os.cpu_count() or 1
+if AI_VISION_AVAILABLE:
+    _default_batch_workers = min(_default_batch_workers, AI_BATCH_MAX_WORKERS)
+BATCH_MAX_WORKERS = int(os.environ.get('MARKDOWN_MAGIC_BATCH_WORKERS', _default_batch_workers))
+
+# Started on the first conversion and reused afterwards; see get_batch_pool
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+# Browser cache lifetime for converted file downloads (seconds)
+DOWNLOAD_MAX_AGE = 300
+
+# Persistent cache of converted output, keyed by upload content, filename and settings
+CONVERSION_CACHE_DIR = os.environ.get('MARKDOWN_MAGIC_CACHE_DIR', '/var/cache/mdmagic')
+CONVERSION_CACHE_MAX_ENTRIES = int(os.environ.get('MARKDOWN_MAGIC_CACHE_MAX_ENTRIES', 500))
+
+def init_cache_dir():
+    """Return a writable conversion cache directory, or None if caching is unavailable"""
+    for cache_dir in (CONVERSION_CACHE_DIR, os.path.join(tempfile.gettempdir(), 'markdown_magic_cache')):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            if os.access(cache_dir, os.W_OK):
+                return cache_dir
+        except OSError:
+            continue
+    
+    print("Warning: No writable conversion cache directory, caching disabled")
+    return None
+
+CACHE_DIR = init_cache_dir()
+
+# Prefer RAM-backed tmpfs for temp input/output directories (Linux)
+TMP_BASE = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+def get_temp_base(required_bytes=0):
+    """Return the tmpfs base directory if it has room for the upload, else None (system temp)"""
+    if TMP_BASE is None:
+        return None
+    
+    try:
+        # Leave room for converted output and extracted images alongside the uploads
+        if shutil.disk_usage(TMP_BASE).free < required_bytes * 2:
+            return None
+    except OSError:
+        return None
+    
+    return TMP_BASE
+
+# Form fields sent alongside the uploaded files
+SETTINGS_FIELDS = ('enable_ocr', 'ocr_language', 'extract_images', 'preserve_formatting')
+
+# Read size used when streaming the request body into the multipart parser
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+if STREAMING_FORM_DATA_AVAILABLE:
+    class UploadDirectoryTarget(BaseTarget):
+        """Multipart target that writes each uploaded file into a directory as its bytes arrive"""
+        
+        def __init__(self, directory):
+            super().__init__()
+            self.directory = directory
+            self.file_paths = []
+            self.file_hashes = {}  # file path -> SHA-256 of its contents
+            self._file = None
+            self._digest = None
+        
+        def on_start(self):
+            filename = secure_filename(self.multipart_filename or '')
+            if not filename:
+                return
+            
+            file_path = os.path.join(self.directory, filename)
+            self._file = open(file_path, 'wb')
+            self._digest = hashlib.sha256()
+            self.file_paths.append(file_path)
+        
+        def on_data_received(self, chunk):
+            if self._file is not None:
+                self._digest.update(chunk)
+                self._file.write(chunk)
+        
+        def on_finish(self):
+            if self._file is not None:
+                self._file.close()
+                self.file_hashes[self.file_paths[-1]] = self._digest.hexdigest()
+                self._file = None
+                self._digest = None
 
-# Store conversion results temporarily
-conversion_results = {}
+def save_stream(stream, file_path):
+    """Copy an upload stream to file_path, returning the SHA-256 of its contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'wb') as f:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            f.write(chunk)
+    
+    return digest.hexdigest()
+
+def save_uploaded_files(temp_input_dir):
+    """
+    Save the uploaded files into temp_input_dir
+    
+    Returns:
+        Tuple[List[str], dict, dict]: (saved_file_paths, file_hashes, form_values)
+    """
+    if STREAMING_FORM_DATA_AVAILABLE and request.mimetype == 'multipart/form-data':
+        # Parse the body as it streams in, writing file parts straight to disk
+        parser = StreamingFormDataParser(headers={'Content-Type': request.content_type})
+        file_target = UploadDirectoryTarget(temp_input_dir)
+        parser.register('files', file_target)
+        
+        value_targets = {}
+        for field in SETTINGS_FIELDS:
+            value_targets[field] = ValueTarget()
+            parser.register(field, value_targets[field])
+        
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.data_received(chunk)
+        
+        form_values = {
+            field: target.value.decode('utf-8', errors='replace')
+            for field, target in value_targets.items() if target.value
+        }
+        return file_target.file_paths, file_target.file_hashes, form_values
+    
+    # Fallback: Werkzeug's built-in multipart parser
+    input_files = []
+    file_hashes = {}
+    for file in request.files.getlist('files'):
+        if file.filename:
+            filename = secure_filename(file.filename)
+            file_path = os.path.join(temp_input_dir, filename)
+            file_hashes[file_path] = save_stream(file.stream, file_path)
+            input_files.append(file_path)
+    
+    return input_files, file_hashes, request.form
+
+def conversion_cache_key(file_hash, filename, settings):
+    """Build the cache key for an upload from its content hash, name and conversion settings"""
+    # The filename is part of the key because it names the output and its image folder
+    settings_json = json.dumps(settings, sort_keys=True)
+    return hashlib.sha256(f"{file_hash}\0{filename}\0{settings_json}".encode('utf-8')).hexdigest()
+
+def restore_from_cache(cache_key, output_dir):
+    """Copy a cached conversion into output_dir, returning the Markdown path (None on a miss)"""
+    entry_dir = os.path.join(CACHE_DIR, cache_key)
+    try:
+        names = os.listdir(entry_dir)
+    except OSError:
+        return None
+    
+    markdown_names = [name for name in names if name.endswith('.md')]
+    if len(markdown_names) != 1:
+        return None
+    
+    # Let the normal conversion handle name clashes within the session
+    if any(os.path.exists(os.path.join(output_dir, name)) for name in names):
+        return None
+    
+    try:
+        for name in names:
+            source = os.path.join(entry_dir, name)
+            if os.path.isdir(source):
+                shutil.copytree(source, os.path.join(output_dir, name))
+            else:
+                shutil.copy2(source, output_dir)
+        os.utime(entry_dir)  # Mark as recently used for eviction
+    except OSError as e:
+        print(f"Error restoring cached conversion {cache_key}: {e}")
+        return None
+    
+    return os.path.join(output_dir, markdown_names[0])
+
+def store_in_cache(cache_key, markdown_path):
+    """Save a converted Markdown file and its image folder under cache_key"""
+    entry_dir = os.path.join(CACHE_DIR, cache_key)
+    if os.path.exists(entry_dir):
+        return
+    
+    # Build the entry beside its final location, then rename it into place
+    partial_dir = f"{entry_dir}.{uuid.uuid4().hex}.partial"
+    try:
+        os.makedirs(partial_dir)
+        shutil.copy2(markdown_path, partial_dir)
+        
+        images_dir = f"{os.path.splitext(markdown_path)[0]}_images"
+        if os.path.isdir(images_dir):
+            shutil.copytree(images_dir, os.path.join(partial_dir, os.path.basename(images_dir)))
+        
+        os.rename(partial_dir, entry_dir)
+    except OSError as e:
+        print(f"Error caching conversion {cache_key}: {e}")
+        shutil.rmtree(partial_dir, ignore_errors=True)
+
+def evict_cache_entries():
+    """Remove least recently used cache entries beyond CONVERSION_CACHE_MAX_ENTRIES"""
+    try:
+        entries = [
+            entry for entry in os.scandir(CACHE_DIR)
+            if entry.is_dir() and not entry.name.endswith('.partial')
+        ]
+        if len(entries) <= CONVERSION_CACHE_MAX_ENTRIES:
+            return
+        
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - CONVERSION_CACHE_MAX_ENTRIES]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    except OSError as e:
+        print(f"Error evicting conversion cache entries: {e}")
 
 # HTML Template
 HTML_TEMPLATE = """
@@ -574,6 +860,31 @@ HTML_TEMPLATE = """
             });
         }
         
+        // Text formats compress well; gzip the upload body when they make up most of it
+        const TEXT_EXTENSIONS = ['txt', 'html', 'htm', 'rtf'];
+        
+        async function buildUploadRequest(formData) {
+            const totalBytes = selectedFiles.reduce((sum, file) => sum + file.size, 0);
+            const textBytes = selectedFiles
+                .filter(file => TEXT_EXTENSIONS.includes(file.name.split('.').pop().toLowerCase()))
+                .reduce((sum, file) => sum + file.size, 0);
+            
+            if (typeof CompressionStream === 'undefined' || textBytes * 2 < totalBytes) {
+                return { method: 'POST', body: formData };
+            }
+            
+            const multipart = new Response(formData);
+            const compressed = multipart.body.pipeThrough(new CompressionStream('gzip'));
+            return {
+                method: 'POST',
+                headers: {
+                    'Content-Type': multipart.headers.get('Content-Type'),
+                    'Content-Encoding': 'gzip'
+                },
+                body: await new Response(compressed).blob()
+            };
+        }
+        
         function updateConvertButton() {
             const convertBtn = document.getElementById('convertBtn');
             convertBtn.disabled = selectedFiles.length === 0;
@@ -610,10 +921,7 @@ HTML_TEMPLATE = """
             results.style.display = 'none';
             
             try {
-                const response = await fetch('/convert', {
-                    method: 'POST',
-                    body: formData
-                });
+                const response = await fetch('/convert', await buildUploadRequest(formData));
                 
                 if (response.ok) {
                     const result = await response.json();
@@ -689,69 +997,128 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page has no template variables, so it is rendered (and compressed) once at import
+INDEX_BYTES = HTML_TEMPLATE.encode('utf-8')
+INDEX_ETAG = hashlib.md5(INDEX_BYTES).hexdigest()
+INDEX_MAX_AGE = 86400  # 1 day
+
+# Content-Encoding -> (body, etag), in order of preference
+INDEX_VARIANTS = {}
+if BROTLI_AVAILABLE:
+    INDEX_VARIANTS['br'] = (brotli.compress(INDEX_BYTES, quality=11), f"{INDEX_ETAG}-br")
+INDEX_VARIANTS['gzip'] = (gzip.compress(INDEX_BYTES, 9), f"{INDEX_ETAG}-gzip")
+
 @app.route('/')
 def index():
     """Main page"""
-    return render_template_string(HTML_TEMPLATE)
+    body, etag, content_encoding = INDEX_BYTES, INDEX_ETAG, None
+    for encoding, (encoded_body, encoded_etag) in INDEX_VARIANTS.items():
+        if request.accept_encodings[encoding] > 0:
+            body, etag, content_encoding = encoded_body, encoded_etag, encoding
+            break
+    
+    response = Response(body, mimetype='text/html')
+    if content_encoding:
+        response.headers['Content-Encoding'] = content_encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = INDEX_MAX_AGE
+    return response.make_conditional(request)
 
 @app.route('/convert', methods=['POST'])
 def convert_files():
     """Handle file conversion"""
+    # Until the session is stored, the temp directories belong to this request
+    # and are removed on any early return or failure (e.g. a client dropping
+    # mid-upload), since nothing else would ever find them
+    temp_input_dir = temp_output_dir = None
+    session_stored = False
     try:
-        files = request.files.getlist('files')
-        if not files or len(files) == 0:
+        # Create temporary directories
+        session_id = str(uuid.uuid4())
+        # Gzip uploads have no Content-Length; budget for the largest request we accept
+        upload_size = request.content_length
+        if upload_size is None:
+            upload_size = app.config['MAX_CONTENT_LENGTH']
+        temp_base = get_temp_base(upload_size)
+        temp_input_dir = tempfile.mkdtemp(prefix=f'markdown_magic_input_{session_id}_', dir=temp_base)
+        temp_output_dir = tempfile.mkdtemp(prefix=f'markdown_magic_output_{session_id}_', dir=temp_base)
+        
+        # Save uploaded files
+        input_files, file_hashes, form_values = save_uploaded_files(temp_input_dir)
+        if not input_files:
             return jsonify({'error': 'No files provided'}), 400
         
         # Get settings
         settings = {
-            'enable_ocr': request.form.get('enable_ocr') == 'true',
-            'ocr_language': request.form.get('ocr_language', 'eng'),
-            'extract_images': request.form.get('extract_images') == 'true',
-            'preserve_formatting': request.form.get('preserve_formatting') == 'true'
+            'enable_ocr': form_values.get('enable_ocr') == 'true',
+            'ocr_language': form_values.get('ocr_language', 'eng'),
+            'extract_images': form_values.get('extract_images') == 'true',
+            'preserve_formatting': form_values.get('preserve_formatting') == 'true'
         }
         
-        # Create temporary directories
-        session_id = str(uuid.uuid4())
-        temp_input_dir = tempfile.mkdtemp(prefix=f'markdown_magic_input_{session_id}_')
-        temp_output_dir = tempfile.mkdtemp(prefix=f'markdown_magic_output_{session_id}_')
-        
-        # Save uploaded files
-        input_files = []
-        for file in files:
-            if file.filename:
-                filename = secure_filename(file.filename)
-                file_path = os.path.join(temp_input_dir, filename)
-                file.save(file_path)
-                input_files.append(file_path)
-        
-        # Initialize converter and batch processor
-        converter = DocumentConverter()
-        batch_processor = BatchProcessor()
-        
-        # Configure converter with settings
-        if hasattr(converter, 'configure_ocr'):
-            converter.configure_ocr(
-                enabled=settings['enable_ocr'],
-                language=settings['ocr_language']
+        # Reuse cached conversions of identical uploads
+        cached_outputs = []
+        cache_keys = {}
+        files_to_convert = []
+        for file_path in input_files:
+            if CACHE_DIR and file_path in file_hashes:
+                cache_key = conversion_cache_key(file_hashes[file_path], os.path.basename(file_path), settings)
+                cached_output = restore_from_cache(cache_key, temp_output_dir)
+                if cached_output:
+                    cached_outputs.append(cached_output)
+                    continue
+                cache_keys[file_path] = cache_key
+            files_to_convert.append(file_path)
+        
+        if files_to_convert:
+            # Convert on the shared worker pool; its workers hold the converters
+            batch_pool = get_batch_pool()
+            batch_processor = BatchProcessor(executor=batch_pool)
+            
+            # Process files
+            try:
+                results = batch_processor.process_batch(
+                    files_to_convert,
+                    temp_output_dir,
+                    BATCH_CONVERTER
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory): start a fresh pool next time
+                discard_batch_pool(batch_pool)
+                raise
+            
+            # Promote new conversions into the cache
+            for file_path, output_path in results.converted_files.items():
+                if file_path in cache_keys:
+                    store_in_cache(cache_keys[file_path], output_path)
+            if cache_keys:
+                evict_cache_entries()
+        else:
+            results = BatchResult(
+                successful_files=[],
+                failed_files=[],
+                total_size_mb=0.0,
+                total_files=0,
+                skipped_files=[]
             )
         
-        # Process files
-        results = batch_processor.process_batch(
-            input_files,
-            temp_output_dir,
-            converter
-        )
+        results.successful_files = cached_outputs + results.successful_files
+        results.total_files += len(cached_outputs)
         
         # Store results for download
-        conversion_results[session_id] = {
+        store_session(session_id, {
             'input_dir': temp_input_dir,
             'output_dir': temp_output_dir,
             'results': results,
-            'timestamp': time.time()
-        }
+            'timestamp': time.time(),
+            'size_bytes': directory_size(temp_input_dir) + directory_size(temp_output_dir)
+        })
+        session_stored = True
         
-        # Clean old results (older than 1 hour)
-        cleanup_old_results()
+        # Old results are removed by the background sweeper, not on the request path
+        start_cleanup_thread()
         
         return jsonify({
             'session_id': session_id,
@@ -762,69 +1129,222 @@ def convert_files():
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    
+    finally:
+        if not session_stored:
+            for temp_dir in (temp_input_dir, temp_output_dir):
+                if temp_dir:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
 
 @app.route('/download/<session_id>/<filename>')
 def download_file(session_id, filename):
     """Download individual converted file"""
-    if session_id not in conversion_results:
+    result_data = get_session(session_id)
+    if result_data is None:
         return "Session not found", 404
     
-    result_data = conversion_results[session_id]
     file_path = os.path.join(result_data['output_dir'], filename)
     
     if not os.path.exists(file_path):
         return "File not found", 404
     
-    return send_file(file_path, as_attachment=True, download_name=filename)
+    # Conditional responses allow ETag revalidation and Range requests; the WSGI
+    # server's file wrapper can then use sendfile() instead of copying in Python
+    return send_file(
+        file_path,
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
+        etag=True,
+        max_age=DOWNLOAD_MAX_AGE
+    )
 
 @app.route('/download_all/<session_id>')
 def download_all(session_id):
     """Download all converted files as ZIP"""
-    if session_id not in conversion_results:
+    result_data = get_session(session_id)
+    if result_data is None:
         return "Session not found", 404
     
-    result_data = conversion_results[session_id]
     results = result_data['results']
     
-    # Create ZIP file
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for file_path in results.successful_files:
-            filename = os.path.basename(file_path)
-            zip_file.write(file_path, filename)
-    
-    zip_buffer.seek(0)
+    # Build the ZIP once per session and serve the cached archive afterwards
+    archive_path = os.path.join(result_data['output_dir'], ARCHIVE_NAME)
+    if not os.path.exists(archive_path):
+        partial_path = f"{archive_path}.{uuid.uuid4().hex}.partial"
+        with zipfile.ZipFile(partial_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            for file_path in results.successful_files:
+                filename = os.path.basename(file_path)
+                zip_file.write(file_path, filename)
+        os.replace(partial_path, archive_path)
+        # The archive lives in the session's directory, so it counts towards its size
+        record_session_archive(session_id, os.path.getsize(archive_path))
     
     return send_file(
-        io.BytesIO(zip_buffer.getvalue()),
+        archive_path,
         mimetype='application/zip',
         as_attachment=True,
-        download_name='markdown_magic_conversion.zip'
+        download_name=ARCHIVE_NAME,
+        conditional=True,
+        max_age=DOWNLOAD_MAX_AGE
     )
 
+def directory_size(path):
+    """Total size in bytes of the files under path"""
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += directory_size(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    
+    return total
+
+# Converter settings the pool workers build from (AI on, default Tesseract path)
+BATCH_CONVERTER = ConverterConfig(DocumentConverter)
+
+def get_batch_pool():
+    """Return the process pool shared by all requests, starting it on first use"""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            # Spawned rather than forked: forking this threaded server could copy
+            # locks held by other request threads into the workers
+            _batch_pool = create_worker_pool(BATCH_MAX_WORKERS, BATCH_CONVERTER,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return _batch_pool
+
+def discard_batch_pool(pool):
+    """Drop the shared pool after it broke, so the next request starts a new one"""
+    global _batch_pool
+    with _batch_pool_lock:
+        # Another request may already have replaced it
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False)
+
+def get_session(session_id):
+    """Return a session's stored data (or None), read under the results lock"""
+    with _results_lock:
+        return conversion_results.get(session_id)
+
+def store_session(session_id, data):
+    """Store a session's results, evicting the oldest sessions beyond MAX_SESSIONS / MAX_SESSION_BYTES"""
+    global _results_total_bytes
+    
+    with _results_lock:
+        conversion_results[session_id] = data
+        conversion_results.move_to_end(session_id)
+        _results_total_bytes += data['size_bytes']
+        heapq.heappush(_expiry_heap, (data['timestamp'] + SESSION_TTL_SECONDS, session_id))
+        evicted = _evict_oldest_sessions()
+    
+    for old_session_id, old_data in evicted:
+        remove_session_dirs(old_session_id, old_data)
+
+def record_session_archive(session_id, archive_bytes):
+    """Count a session's download archive in its size, evicting the oldest sessions
+    if that takes the total beyond MAX_SESSION_BYTES"""
+    global _results_total_bytes
+    
+    with _results_lock:
+        data = conversion_results.get(session_id)
+        if data is None:
+            # Already evicted or expired; its directories are being removed
+            return
+        
+        # Concurrent downloads may both build the archive; count it only once
+        added_bytes = archive_bytes - data.get('archive_bytes', 0)
+        data['archive_bytes'] = archive_bytes
+        data['size_bytes'] += added_bytes
+        _results_total_bytes += added_bytes
+        
+        # The session being downloaded is in use: keep it, as store_session keeps a new one
+        conversion_results.move_to_end(session_id)
+        evicted = _evict_oldest_sessions()
+    
+    for old_session_id, old_data in evicted:
+        remove_session_dirs(old_session_id, old_data)
+
+def _evict_oldest_sessions():
+    """Pop the oldest sessions beyond MAX_SESSIONS / MAX_SESSION_BYTES; call with
+    _results_lock held and remove the returned sessions' directories after releasing it"""
+    global _results_total_bytes
+    evicted = []
+    
+    # Always keep the newest session
+    while len(conversion_results) > 1 and (
+            len(conversion_results) > MAX_SESSIONS or _results_total_bytes > MAX_SESSION_BYTES):
+        old_session_id, old_data = conversion_results.popitem(last=False)
+        _results_total_bytes -= old_data['size_bytes']
+        evicted.append((old_session_id, old_data))
+    
+    return evicted
+
+def remove_session_dirs(session_id, data):
+    """Delete the temporary directories belonging to a session"""
+    try:
+        if os.path.exists(data['input_dir']):
+            shutil.rmtree(data['input_dir'])
+        if os.path.exists(data['output_dir']):
+            shutil.rmtree(data['output_dir'])
+    except Exception as e:
+        print(f"Error cleaning up session {session_id}: {e}")
+
 def cleanup_old_results():
-    """Clean up old conversion results"""
-    import time
+    """
+    Clean up expired conversion results
+    
+    Returns:
+        float: Seconds until the next session expires
+    """
+    global _results_total_bytes
     current_time = time.time()
-    sessions_to_remove = []
+    expired = []
     
-    for session_id, data in conversion_results.items():
-        # Remove sessions older than 1 hour
-        if current_time - data['timestamp'] > 3600:
-            sessions_to_remove.append(session_id)
-            
-            # Clean up temporary directories
-            try:
-                import shutil
-                if os.path.exists(data['input_dir']):
-                    shutil.rmtree(data['input_dir'])
-                if os.path.exists(data['output_dir']):
-                    shutil.rmtree(data['output_dir'])
-            except Exception as e:
-                print(f"Error cleaning up session {session_id}: {e}")
-    
-    for session_id in sessions_to_remove:
-        del conversion_results[session_id]
+    with _results_lock:
+        while _expiry_heap and _expiry_heap[0][0] <= current_time:
+            _, session_id = heapq.heappop(_expiry_heap)
+            # Sessions already evicted for size are no longer in conversion_results
+            data = conversion_results.pop(session_id, None)
+            if data is not None:
+                _results_total_bytes -= data['size_bytes']
+                expired.append((session_id, data))
+        
+        next_expiry = _expiry_heap[0][0] if _expiry_heap else current_time + SESSION_TTL_SECONDS
+    
+    # Remove directories outside the lock so requests are not blocked on disk I/O
+    for session_id, data in expired:
+        remove_session_dirs(session_id, data)
+    
+    return max(next_expiry - time.time(), 0)
+
+def _cleanup_loop():
+    """Background sweeper: sleep until the oldest session expires, then remove it"""
+    while True:
+        try:
+            delay = cleanup_old_results()
+        except Exception as e:
+            print(f"Error during session cleanup: {e}")
+            delay = 60
+        # New sessions always expire after the current head, so sleeping until then is safe
+        time.sleep(max(delay, 1))
+
+def start_cleanup_thread():
+    """Start the background session sweeper once per process"""
+    global _cleanup_thread
+    
+    if _cleanup_thread is not None and _cleanup_thread.is_alive():
+        return
+    
+    with _results_lock:
+        if _cleanup_thread is None or not _cleanup_thread.is_alive():
+            _cleanup_thread = threading.Thread(target=_cleanup_loop, name='session-cleanup', daemon=True)
+            _cleanup_thread.start()
 
 @app.route('/health')
 def health_check():
@@ -7,11 +7,17 @@ Enhanced with AI-powered image descriptions
 
 import os
 import io
+import functools
+import logging
+import threading
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 import subprocess
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageChops, ImageStat
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -20,12 +26,20 @@ except ImportError:
 
 try:
     import pytesseract
+    from pytesseract import Output
     TESSERACT_AVAILABLE = True
 except ImportError:
     TESSERACT_AVAILABLE = False
     print("Warning: pytesseract not installed. OCR will be disabled.")
     print("Install with: pip3 install pytesseract")
 
+# Optional: tesserocr runs libtesseract in-process instead of one subprocess per call
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 # Try to import AI vision processor
 try:
     from ai_vision_processor import AIVisionProcessor
@@ -33,6 +47,108 @@ try:
 except ImportError:
     AI_VISION_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Words Tesseract is less confident about than this (0-100) are dropped from alt text
+OCR_MIN_WORD_CONFIDENCE = 50
+
+# Block OCR whose mean word confidence is above this is accepted without a single-line retry
+OCR_ACCEPT_CONFIDENCE = 60
+
+# Text pre-screen: images with less edge detail or contrast than this skip OCR
+TEXT_SCREEN_SIZE = (64, 64)
+TEXT_SCREEN_MIN_EDGES = 8
+TEXT_SCREEN_MIN_STDDEV = 20
+
+# JPEGs larger than this (pixels on the long side) are decoded at reduced scale for OCR;
+# Tesseract gains nothing beyond roughly 300 DPI
+OCR_DRAFT_MIN_SIZE = 2000
+OCR_DRAFT_SIZE = (1600, 1600)
+
+
+@functools.lru_cache(maxsize=None)
+def probe_tesseract(tesseract_cmd='tesseract'):
+    """
+    Return the first line of `tesseract --version`, or None if it can't be run
+    
+    Cached, so each Tesseract binary is executed at most once per process no
+    matter how many ImageProcessors are created.
+    """
+    try:
+        result = subprocess.run([tesseract_cmd, '--version'],
+                                capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    
+    if result.returncode != 0:
+        return None
+    
+    # Older Tesseract releases print their version to stderr
+    return (result.stdout or result.stderr).split('\n')[0]
+
+
+def _open_for_ocr(image_bytes):
+    """Open image bytes for OCR, letting libjpeg decode oversized JPEGs at reduced scale"""
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.format == 'JPEG' and max(image.size) > OCR_DRAFT_MIN_SIZE:
+        image.draft('L', OCR_DRAFT_SIZE)
+    return image
+
+
+# Basic processor owned by each OCR worker process, created once by _init_ocr_worker
+_worker_processor = None
+
+
+def _init_ocr_worker(tesseract_path):
+    """Create the ImageProcessor a worker process reuses for all of its images"""
+    global _worker_processor
+    _worker_processor = ImageProcessor(tesseract_path=tesseract_path, enable_ai=False)
+
+
+def _ocr_worker(image_bytes):
+    """Decode one image and return the text OCR finds in it (runs in a worker process)"""
+    return _worker_processor.recognize_text(_open_for_ocr(image_bytes))
+
+
+# OCR worker pool shared by every ImageProcessor in this process (see _get_ocr_pool)
+_ocr_pool = None
+_ocr_pool_cmd = None  # Tesseract command its workers were started with
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool(tesseract_cmd):
+    """
+    Return this process's OCR worker pool, starting it on first use
+    
+    The pool lives as long as the process, so each worker creates its processor
+    (and probes Tesseract) once rather than once per document. Workers are spawned,
+    not forked, because the writer thread of an ImageProcessor may be running.
+    """
+    global _ocr_pool, _ocr_pool_cmd
+    with _ocr_pool_lock:
+        if _ocr_pool is not None and _ocr_pool_cmd != tesseract_cmd:
+            _ocr_pool.shutdown(wait=False)
+            _ocr_pool = None
+        if _ocr_pool is None:
+            _ocr_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_ocr_worker,
+                initargs=(tesseract_cmd,)
+            )
+            _ocr_pool_cmd = tesseract_cmd
+        return _ocr_pool
+
+
+def _discard_ocr_pool():
+    """Drop a broken OCR pool so the next batch starts a new one"""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
 class ImageProcessor:
     """Handles image extraction, processing, and OCR for document conversion"""
     
@@ -41,6 +157,13 @@ class ImageProcessor:
         self.tesseract_available = TESSERACT_AVAILABLE
         self.pil_available = PIL_AVAILABLE
         self.current_output_dir = None  # Track current output directory
+        self._tess_api = None  # In-process Tesseract handle when tesserocr is installed
+        self._write_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # Image file writes, one in flight at a time
+        self._md_folder = None  # Image folder of the current document
+        self._image_folder_path = None  # Its full path on disk
+        self._saved_count = 0  # Images saved for the current document
+        self._md_ext = 'png'  # Lower-cased extension of its images given without a format
+        self._md_prefix = None  # "](<folder>/image_" for building its placeholders
         
         # Initialize AI vision processor if available
         self.ai_processor = None
@@ -60,27 +183,35 @@ class ImageProcessor:
                 
             # Test if Tesseract is working
             if self.tesseract_available:
-                try:
-                    # Try using subprocess to check Tesseract version
-                    result = subprocess.run(['tesseract', '--version'], 
-                                           capture_output=True, text=True, check=False)
-                    if result.returncode == 0:
-                        version = result.stdout.split('\n')[0]
-                        print(f"✓ Tesseract OCR available: {version}")
-                        self.tesseract_available = True
-                    else:
-                        # Try using pytesseract
-                        version = pytesseract.get_tesseract_version()
-                        print(f"✓ Tesseract OCR available via pytesseract: {version}")
-                        self.tesseract_available = True
-                except Exception as e:
-                    print(f"Warning: Tesseract OCR not available: {e}")
+                version = probe_tesseract(pytesseract.pytesseract.tesseract_cmd)
+                if version is not None:
+                    print(f"✓ Tesseract OCR available: {version}")
+                else:
+                    print("Warning: Tesseract OCR not available: could not run tesseract --version")
                     self.tesseract_available = False
             else:
                 print("Warning: Tesseract OCR not available: pytesseract not installed")
+            
+            # Create the libtesseract handle once; it is expensive to construct
+            if self.tesseract_available and TESSEROCR_AVAILABLE:
+                try:
+                    self._tess_api = tesserocr.PyTessBaseAPI(
+                        psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY
+                    )
+                    print("✓ Using in-process Tesseract via tesserocr")
+                except Exception as e:
+                    print(f"Warning: Could not initialize tesserocr, using pytesseract: {e}")
+                    self._tess_api = None
     
-    def create_image_folder(self, output_file):
-        """Create an image folder for the converted document"""
+    def create_image_folder(self, output_file, image_format='png'):
+        """
+        Create an image folder for the converted document
+        
+        Args:
+            output_file: Markdown file being written
+            image_format: Format of the document's images, used for every image
+                processed without an original_format
+        """
         output_dir = os.path.dirname(output_file)
         self.current_output_dir = output_dir  # Store for later use
         
@@ -93,42 +224,50 @@ class ImageProcessor:
             os.makedirs(image_folder_path)
             print(f"✓ Created image folder: {image_folder_path}")
         
+        # Every image and placeholder of this document shares the same folder
+        self._md_folder = image_folder_name
+        self._image_folder_path = image_folder_path
+        self._md_prefix = f"]({image_folder_name}/image_"
+        self._md_ext = image_format.lower()
+        self._saved_count = 0
+        
         return image_folder_name
     
     def process_image(self, image_bytes, image_number, images_folder, position_info='', 
-                     existing_alt='', existing_caption='', original_format='png'):
-        """Process an image: save and generate AI-enhanced alt text"""
+                     existing_alt='', existing_caption='', original_format=None, image=None):
+        """
+        Process an image: save and generate AI-enhanced alt text
+        
+        Pass the already opened PIL image as image to avoid decoding image_bytes again.
+        Without an original_format, the document's image format is used (see
+        create_image_folder).
+        """
+        ext = self._extension(original_format)
+        
         try:
             # Use AI processor if available
             if self.ai_processor is not None:
                 return self.ai_processor.process_image(
                     image_bytes, image_number, images_folder, position_info,
-                    existing_alt, existing_caption, original_format
+                    existing_alt, existing_caption, ext
                 )
             
             # Fallback to basic processing
             if not self.pil_available:
                 raise ImportError("PIL/Pillow not installed - cannot process images")
                 
-            # Open image for OCR but don't modify it
-            image = Image.open(io.BytesIO(image_bytes))
-            
             # Generate filename with original extension
-            image_filename = f"image_{image_number}.{original_format.lower()}"
+            image_filename = f"image_{image_number}.{ext}"
             
             # Use the stored output directory
             if self.current_output_dir is None:
                 raise ValueError("No output directory set. Call create_image_folder first.")
             
-            image_folder_path = os.path.join(self.current_output_dir, images_folder)
-            if not os.path.exists(image_folder_path):
-                os.makedirs(image_folder_path)
-            
-            # Save original image bytes without conversion
-            image_path = os.path.join(image_folder_path, image_filename)
-            with open(image_path, 'wb') as f:
-                f.write(image_bytes)
-            print(f"✓ Saved image: {image_path}")
+            # Save original image bytes without conversion, on the writer thread
+            # so the disk write overlaps with OCR below
+            pending_write = self._write_executor.submit(
+                self._save_image, image_bytes, images_folder, image_filename
+            )
             
             # Generate alt text (use existing if provided)
             if existing_alt:
@@ -136,10 +275,16 @@ class ImageProcessor:
             elif existing_caption:
                 alt_text = existing_caption
             else:
+                # Only OCR needs the decoded image; saving uses the raw bytes
+                if image is None:
+                    image = _open_for_ocr(image_bytes)
                 alt_text = self.generate_alt_text(image, image_number, position_info)
             
+            # The file must be on disk before its placeholder is handed out
+            pending_write.result()
+            
             # Create markdown placeholder
-            markdown_placeholder = f"![{alt_text}]({images_folder}/{image_filename})"
+            markdown_placeholder = self._markdown_image(alt_text, image_number, images_folder, ext)
             
             return markdown_placeholder
             
@@ -147,14 +292,126 @@ class ImageProcessor:
             print(f"Warning: Could not process image {image_number}: {e}")
             # Return a placeholder anyway
             alt_text = f"Image ({image_number}), {position_info}, Could not process image:"
-            image_filename = f"image_{image_number}.{original_format.lower()}"
-            return f"![{alt_text}]({images_folder}/{image_filename})"
+            return self._markdown_image(alt_text, image_number, images_folder, ext)
+    
+    def process_images_batch(self, jobs):
+        """
+        Process several images of one document, running their OCR in parallel
+        
+        Args:
+            jobs: List of dicts holding the keyword arguments of process_image
+            
+        Returns:
+            List of markdown placeholders in the same order as jobs
+        """
+        if self.ai_processor is not None:
+            return self.ai_processor.process_images_batch(jobs)
+        
+        # Only images without alt text or caption need OCR
+        ocr_indexes = [
+            i for i, job in enumerate(jobs)
+            if not job.get('existing_alt') and not job.get('existing_caption')
+        ]
+        
+        # A worker pool only pays off when there is more than one image to OCR. Inside
+        # a worker process (e.g. a parallel BatchProcessor's) files are already
+        # converted in parallel, and a pool per worker would multiply the processes.
+        if (not self.pil_available or not self.tesseract_available
+                or self.current_output_dir is None or len(ocr_indexes) < 2
+                or multiprocessing.parent_process() is not None):
+            placeholders = [self.process_image(**job) for job in jobs]
+            print(f"✓ Saved {self._saved_count} images to {self._image_folder_path}")
+            return placeholders
+        
+        try:
+            placeholders = self._process_images_parallel(jobs, ocr_indexes)
+        except Exception as e:
+            # e.g. no process support in a frozen app, or a worker died
+            print(f"Warning: Parallel OCR unavailable, processing images one by one: {e}")
+            if isinstance(e, BrokenProcessPool):
+                _discard_ocr_pool()
+            placeholders = [self.process_image(**job) for job in jobs]
+        
+        print(f"✓ Saved {self._saved_count} images to {self._image_folder_path}")
+        return placeholders
     
-    def create_markdown_placeholder(self, image_number, position_info, description, image_folder_name, original_format='png'):
+    def _process_images_parallel(self, jobs, ocr_indexes):
+        """Save images on this thread while worker processes run their OCR"""
+        placeholders = []
+        
+        executor = _get_ocr_pool(pytesseract.pytesseract.tesseract_cmd)
+        futures = {i: executor.submit(_ocr_worker, jobs[i]['image_bytes']) for i in ocr_indexes}
+        
+        for i, job in enumerate(jobs):
+            image_number = job['image_number']
+            images_folder = job['images_folder']
+            position_info = job.get('position_info', '')
+            ext = self._extension(job.get('original_format'))
+            image_filename = f"image_{image_number}.{ext}"
+            
+            try:
+                self._save_image(job['image_bytes'], images_folder, image_filename)
+            except Exception as e:
+                print(f"Warning: Could not process image {image_number}: {e}")
+                if i in futures:
+                    futures[i].cancel()
+                alt_text = f"Image ({image_number}), {position_info}, Could not process image:"
+                placeholders.append(self._markdown_image(alt_text, image_number, images_folder, ext))
+                continue
+            
+            if i in futures:
+                try:
+                    alt_text = self._format_alt_text(image_number, position_info, futures[i].result())
+                except Exception as e:
+                    print(f"Warning: OCR failed for image {image_number}: {e}")
+                    alt_text = f"Image ({image_number}), {position_info}, OCR failed:"
+            else:
+                alt_text = job.get('existing_alt') or job.get('existing_caption')
+            
+            placeholders.append(self._markdown_image(alt_text, image_number, images_folder, ext))
+        
+        return placeholders
+    
+    def _save_image(self, image_bytes, images_folder, image_filename):
+        """Write original image bytes into the document's image folder"""
+        # The folder already exists: create_image_folder made it for this document
+        if images_folder == self._md_folder:
+            image_folder_path = self._image_folder_path
+        else:
+            image_folder_path = os.path.join(self.current_output_dir, images_folder)
+            os.makedirs(image_folder_path, exist_ok=True)
+        image_path = os.path.join(image_folder_path, image_filename)
+        
+        # Raw descriptor writes skip the buffered file object; one write call
+        # normally covers the whole image
+        fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        self._saved_count += 1
+        logger.debug("Saved image: %s", image_path)
+    
+    def create_markdown_placeholder(self, image_number, position_info, description, image_folder_name, original_format=None):
         """Create a markdown placeholder for an image"""
         alt_text = f"Image ({image_number}), {position_info}, {description}:"
-        image_filename = f"image_{image_number}.{original_format.lower()}"
-        return f"![{alt_text}]({image_folder_name}/{image_filename})"
+        return self._markdown_image(alt_text, image_number, image_folder_name, self._extension(original_format))
+    
+    def _extension(self, original_format):
+        """Lower-cased file extension for an image, the document's when no format is given"""
+        if original_format is None:
+            return self._md_ext
+        return original_format.lower()
+    
+    def _markdown_image(self, alt_text, image_number, images_folder, ext):
+        """Build a markdown image reference, reusing the current document's link prefix"""
+        if images_folder == self._md_folder:
+            prefix = self._md_prefix
+        else:
+            prefix = f"]({images_folder}/image_"
+        return f"![{alt_text}{prefix}{image_number}.{ext})"
     
     def generate_alt_text(self, image, image_number, position_info):
         """Generate alt text for an image using OCR"""
@@ -162,48 +419,100 @@ class ImageProcessor:
             return f"Image ({image_number}), {position_info}, OCR not available:"
         
         try:
-            # Enhance image for better OCR
-            enhanced_image = self.enhance_image_for_ocr(image.copy())
-            
-            # Try multiple OCR configurations
-            ocr_text = ""
-            
-            # First try: Standard document OCR
-            try:
-                ocr_text = pytesseract.image_to_string(enhanced_image, config='--psm 3 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ').strip()
-            except:
-                pass
-            
-            # Second try: Single block of text
-            if not ocr_text or len(ocr_text) < 3:
-                try:
-                    ocr_text = pytesseract.image_to_string(enhanced_image, config='--psm 6').strip()
-                except:
-                    pass
-            
-            # Third try: Single line of text
-            if not ocr_text or len(ocr_text) < 3:
-                try:
-                    ocr_text = pytesseract.image_to_string(enhanced_image, config='--psm 7').strip()
-                except:
-                    pass
-            
-            # Clean up the OCR text
-            ocr_text = ' '.join(ocr_text.split())  # Remove extra whitespace
-            
-            # Limit length and clean up
-            if len(ocr_text) > 100:
-                ocr_text = ocr_text[:97] + "..."
-            
-            # If OCR found text, use it
-            if ocr_text and len(ocr_text) > 3:
-                return f"Image ({image_number}), {position_info}, {ocr_text}:"
-            else:
-                return f"Image ({image_number}), {position_info}, Image content:"
-                
+            ocr_text = self.recognize_text(image)
         except Exception as e:
             print(f"Warning: OCR failed for image {image_number}: {e}")
             return f"Image ({image_number}), {position_info}, OCR failed:"
+        
+        return self._format_alt_text(image_number, position_info, ocr_text)
+    
+    def _format_alt_text(self, image_number, position_info, ocr_text):
+        """Build alt text from the OCR result of an image"""
+        # Limit length and clean up
+        if len(ocr_text) > 100:
+            ocr_text = ocr_text[:97] + "..."
+        
+        # If OCR found text, use it
+        if ocr_text and len(ocr_text) > 3:
+            return f"Image ({image_number}), {position_info}, {ocr_text}:"
+        else:
+            return f"Image ({image_number}), {position_info}, Image content:"
+    
+    def recognize_text(self, image):
+        """Run OCR on an image and return the recognized text with whitespace collapsed"""
+        # Photos and flat graphics only give OCR noise, so don't run Tesseract on them
+        if not self._looks_like_text(image):
+            return ""
+        
+        # Enhance image for better OCR
+        enhanced_image = self.enhance_image_for_ocr(image)
+        
+        # Single Tesseract run on the LSTM engine, treating the image as one text block
+        ocr_text, confidence = self._ocr_words(enhanced_image, 6)
+        
+        # Tesseract's own confidence decides whether to retry once as a single line
+        if confidence <= OCR_ACCEPT_CONFIDENCE:
+            line_text, line_confidence = self._ocr_words(enhanced_image, 7)
+            if line_confidence > confidence:
+                ocr_text = line_text
+        
+        # Clean up the OCR text
+        return ' '.join(ocr_text.split())  # Remove extra whitespace
+    
+    def _looks_like_text(self, image):
+        """Cheap check on a 64x64 thumbnail for the sharp, high-contrast edges text produces"""
+        try:
+            small = image.convert('L').resize(TEXT_SCREEN_SIZE)
+        except Exception:
+            return True  # Let OCR decide if the image can't be screened
+        
+        # Mean absolute difference between neighbouring pixels, horizontally and vertically
+        dx = ImageStat.Stat(ImageChops.difference(small, ImageChops.offset(small, 1, 0))).mean[0]
+        dy = ImageStat.Stat(ImageChops.difference(small, ImageChops.offset(small, 0, 1))).mean[0]
+        stddev = ImageStat.Stat(small).stddev[0]
+        
+        return dx + dy > TEXT_SCREEN_MIN_EDGES and stddev > TEXT_SCREEN_MIN_STDDEV
+    
+    def _ocr_words(self, image, psm):
+        """
+        Run Tesseract once and join the words recognized with reasonable confidence
+        
+        Returns:
+            Tuple of (text, mean confidence of all recognized words, 0-100)
+        """
+        try:
+            if self._tess_api is not None:
+                self._tess_api.SetPageSegMode(psm)
+                self._tess_api.SetImage(image)
+                word_confidences = self._tess_api.MapWordConfidences()
+            else:
+                data = pytesseract.image_to_data(
+                    image, config=f'--psm {psm} --oem 1', output_type=Output.DICT
+                )
+                word_confidences = zip(data['text'], data['conf'])
+        except Exception:
+            return "", 0.0
+        
+        word_confidences = [
+            (text, float(conf)) for text, conf in word_confidences
+            if text.strip() and float(conf) >= 0
+        ]
+        if not word_confidences:
+            return "", 0.0
+        
+        words = [
+            text for text, conf in word_confidences if conf > OCR_MIN_WORD_CONFIDENCE
+        ]
+        mean_confidence = sum(conf for _, conf in word_confidences) / len(word_confidences)
+        return ' '.join(words), mean_confidence
+    
+    def _ocr_full_text(self, image):
+        """Run fully automatic page segmentation OCR on a whole image"""
+        if self._tess_api is not None:
+            self._tess_api.SetPageSegMode(tesserocr.PSM.AUTO)
+            self._tess_api.SetImage(image)
+            return self._tess_api.GetUTF8Text().strip()
+        return pytesseract.image_to_string(image, config='--psm 3').strip()
     
     def convert_to_png(self, image_bytes):
         """Convert image bytes to PNG format"""
@@ -213,6 +522,10 @@ class ImageProcessor:
         try:
             image = Image.open(io.BytesIO(image_bytes))
             
+            # Already PNG: hand the bytes back instead of decoding and re-encoding
+            if image.format == 'PNG':
+                return image_bytes
+            
             # Convert to RGB if necessary
             if image.mode in ('RGBA', 'LA', 'P'):
                 # Keep transparency for RGBA
@@ -222,7 +535,8 @@ class ImageProcessor:
             
             # Save to bytes as PNG
             png_bytes = io.BytesIO()
-            image.save(png_bytes, format='PNG')
+            # Fast compression: these are working copies, not distribution artifacts
+            image.save(png_bytes, format='PNG', compress_level=1)
             png_bytes.seek(0)
             
             return png_bytes.getvalue()
@@ -245,8 +559,9 @@ class ImageProcessor:
             raise ImportError("PIL/Pillow not installed - cannot process images")
         
         try:
-            # Open the image file
-            image = Image.open(image_file_path)
+            # Read the file once; the same bytes are saved and decoded for OCR
+            image_bytes = Path(image_file_path).read_bytes()
+            image = _open_for_ocr(image_bytes)
             
             # Generate output filename if not provided
             if output_file is None:
@@ -258,27 +573,21 @@ class ImageProcessor:
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
-            # Create image folder for this document
-            images_folder = self.create_image_folder(output_file)
-            
-            # Read image as bytes for processing
-            with open(image_file_path, 'rb') as f:
-                image_bytes = f.read()
-            
-            # Get original format
+            # Create image folder for this document, in the image's original format
             original_format = Path(image_file_path).suffix[1:]  # Remove the dot
+            images_folder = self.create_image_folder(output_file, original_format)
             
             # Process the image (save without conversion and generate OCR)
             markdown_placeholder = self.process_image(
                 image_bytes, 1, images_folder, f"from {os.path.basename(image_file_path)}", 
-                original_format=original_format
+                image=image
             )
             
             # Generate OCR text
             ocr_text = ""
             if self.tesseract_available:
                 try:
-                    ocr_text = pytesseract.image_to_string(image, config='--psm 3').strip()
+                    ocr_text = self._ocr_full_text(image)
                     ocr_text = ' '.join(ocr_text.split())  # Clean whitespace
                 except Exception as e:
                     print(f"Warning: OCR failed: {e}")
@@ -324,20 +633,20 @@ class ImageProcessor:
             if image.mode != 'L':
                 image = image.convert('L')
             
-            # Increase contrast and brightness
-            from PIL import ImageEnhance
-            
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(1.5)
+            from PIL import ImageFilter
             
-            # Enhance brightness
-            enhancer = ImageEnhance.Brightness(image)
-            image = enhancer.enhance(1.2)
+            # Contrast 1.5 around the mean grey level, then brightness 1.2, fused
+            # into one lookup table so the pixels are only walked once
+            mean = int(ImageStat.Stat(image).mean[0] + 0.5)
+            lut = []
+            for level in range(256):
+                contrasted = min(255, max(0, int(mean + (level - mean) * 1.5)))
+                lut.append(min(255, int(contrasted * 1.2)))
+            image = image.point(lut)
             
-            # Enhance sharpness
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(2.0)
+            # Sharpen with an unsharp mask; Pillow's filter kernels are SIMD-accelerated
+            # under pillow-simd
+            image = image.filter(ImageFilter.UnsharpMask(radius=1, percent=100, threshold=3))
             
             return image
             
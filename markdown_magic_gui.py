@@ -6,8 +6,13 @@ CRT-themed interface that integrates with existing components
 
 import sys
 import os
-import subprocess
-import platform
+import re
+import itertools
+import multiprocessing
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import traceback
 
@@ -15,10 +20,12 @@ try:
     from PyQt5.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
         QLabel, QPushButton, QProgressBar, QFileDialog,
-        QListWidget, QListWidgetItem, QMessageBox, QStatusBar, QCheckBox
+        QListView, QMessageBox, QStatusBar, QCheckBox
     )
-    from PyQt5.QtCore import Qt, QThread, pyqtSignal
-    from PyQt5.QtGui import QFont, QIcon
+    from PyQt5.QtCore import (
+        Qt, QThread, QTimer, QProcess, QUrl, pyqtSignal, QAbstractListModel, QModelIndex
+    )
+    from PyQt5.QtGui import QFont, QIcon, QPainter, QPalette, QDesktopServices
     PYQT_AVAILABLE = True
 except ImportError:
     print("PyQt5 not installed. Run: pip3 install PyQt5")
@@ -33,17 +40,240 @@ except ImportError:
     CONVERTER_AVAILABLE = False
 
 try:
-    from batch_processor import BatchProcessor
+    from ai_vision_processor import AI_VISION_AVAILABLE
+except ImportError:
+    AI_VISION_AVAILABLE = False
+
+try:
+    from batch_processor import BatchProcessor, ConverterConfig
     BATCH_PROCESSOR_AVAILABLE = True
 except ImportError:
     print("Warning: BatchProcessor not available")
     BATCH_PROCESSOR_AVAILABLE = False
 
+# Basic HTML-to-text for the fallback converter: one pattern matches each run of
+# tags and whitespace, so stripping tags and collapsing whitespace is a single pass.
+# It runs on decoded text so that Unicode whitespace such as NBSP collapses too.
+_TAG_WS_RE = re.compile(r'(?:<[^>]+>|(\s))+')
+
+def _tag_ws_replacement(match):
+    # A run that contained whitespace becomes one space; tags alone vanish
+    return ' ' if match.group(1) is not None else ''
+
+# Frontmatter and heading written by the fallback converter, and its error file
+_FM_TMPL = ('---\n'
+            'title: "{title}"\n'
+            'source: "{src}"\n'
+            'converter: "Markdown Magic"\n'
+            '---\n\n'
+            '# {title}\n\n')
+_ERR_TMPL = ('---\n'
+             'title: "Conversion Error - {name}"\n'
+             'converter: "Markdown Magic"\n'
+             '---\n\n'
+             '# Conversion Error\n\n'
+             'Could not convert file: {src}\n'
+             'Error: {error}\n')
+
+# Batch progress stages: status label and percent into the current file
+# (None means the whole file's share of the batch)
+_STAGE_TABLE = {
+    'starting': ('STARTING', 0),
+    'converting': ('PROCESSING', 25),
+    'completed': ('COMPLETED', None),
+    'failed': ('FAILED', None),
+}
+_STAGE_DEFAULT = ('PROCESSING', 50)
+
+# QSS comments and the whitespace around punctuation mean nothing to Qt's parser.
+# (A space before ':' would matter in a selector like "QWidget :hover"; the theme
+# below has none.)
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE_RE = re.compile(r'\s*([{}:;,])\s*|\s+')
+
+def _minify_qss(qss):
+    """Strip comments and redundant whitespace from a Qt stylesheet"""
+    qss = _QSS_COMMENT_RE.sub('', qss)
+    return _QSS_SPACE_RE.sub(lambda m: m.group(1) or ' ', qss).strip()
+
+# Image types the fallback converter hands to the vision processor
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'})
+
+# Types whose conversion can run images through the vision models
+IMAGE_BEARING_EXTENSIONS = IMAGE_EXTENSIONS | {'.pdf', '.docx'}
+
+# Fallback threads for images: one on the vision processor, the rest loading
+# the next files
+IMAGE_POOL_WORKERS = 3
+
+# Seconds between batches of file-completion signals in fallback mode
+COMPLETION_FLUSH_INTERVAL = 0.25
+
+# Upper bound on batch worker processes when AI vision is on (memory per model copy)
+AI_BATCH_MAX_WORKERS = 2
+
+# Minimum seconds between progress/status signals from a conversion worker
+PROGRESS_MIN_INTERVAL = 0.05
+
+def _format_size(size):
+    """Format a byte count as B/KB/MB with one decimal, using integer math only"""
+    if size < 1024:
+        return f"{size}B"
+    shift, unit = (10, "KB") if size < 1024 * 1024 else (20, "MB")
+    # Tenths of a unit, rounded half to even like the float formatting it replaces
+    tenths = (size * 10) >> shift
+    rest = (size * 10) & ((1 << shift) - 1)
+    half = 1 << (shift - 1)
+    if rest > half or (rest == half and tenths & 1):
+        tenths += 1
+    return f"{tenths // 10}.{tenths % 10}{unit}"
+
+def _read_source(path):
+    """Read a source file's bytes without updating its access time where possible"""
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+    noatime = getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(path, flags | noatime)
+    except PermissionError:
+        if not noatime:
+            raise
+        # O_NOATIME is only allowed on files we own
+        fd = os.open(path, flags)
+    with os.fdopen(fd, 'rb') as f:
+        return f.read()
+
+def _read_text(path):
+    """Decode a source file as UTF-8 with universal newlines, as text-mode open does"""
+    text = _read_source(path).decode('utf-8', errors='replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def _file_meta(path):
+    """Return (path, lowercase extension, filename, stem) for a file to convert"""
+    filename = os.path.basename(path)
+    stem, ext = os.path.splitext(filename)
+    return (path, ext.lower(), filename, stem)
+
+def _reserve_output_paths(metas, output_folder):
+    """Pick a unique Markdown output path for each file, as BatchProcessor does
+    
+    Done before any file is converted, so concurrent tasks never write the same
+    output (e.g. for a.pdf and a.docx).
+    """
+    reserved = set()
+    output_paths = []
+    for meta in metas:
+        stem = meta[3]
+        output_file = os.path.join(output_folder, f"{stem}.md")
+        counter = 1
+        while output_file in reserved or os.path.exists(output_file):
+            output_file = os.path.join(output_folder, f"{stem}_{counter}.md")
+            counter += 1
+        reserved.add(output_file)
+        output_paths.append(output_file)
+    return output_paths
+
+# Per-path metadata is looked up on every list insert and progress update
+@lru_cache(maxsize=4096)
+def _basename(path):
+    return os.path.basename(path)
+
+# Lists longer than this are stat'ed on STAT_WORKERS threads
+STAT_PARALLEL_THRESHOLD = 32
+STAT_WORKERS = 8
+
+# Sizes are cached in a plain dict so a folder scan can fill it from its
+# directory entries instead of stat'ing each file again
+_size_cache = {}
+
+def _filesize(path):
+    size = _size_cache.get(path)
+    if size is None:
+        size = _size_cache[path] = os.path.getsize(path)
+    return size
+
+def _filesize_or_none(path):
+    try:
+        return _filesize(path)
+    except OSError:
+        return None
+
+def _filesizes(paths):
+    """Sizes of paths (None where unreadable), stat'ed concurrently for large lists
+    
+    stat() releases the GIL, so on network drives the threads overlap the round trips.
+    """
+    if len(paths) <= STAT_PARALLEL_THRESHOLD:
+        return [_filesize_or_none(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+        return list(pool.map(_filesize_or_none, paths))
+
+def _scan_folder(folder):
+    """Return the paths of the visible files directly inside folder, by name
+    
+    The sizes come from the directory listing and are stored for _filesize.
+    """
+    files = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_file():
+                        _size_cache[entry.path] = entry.stat().st_size
+                        files.append(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        return []
+    files.sort()
+    return files
+
+def _largest_first_key(path):
+    """Sort key that orders files by descending size, then by folder"""
+    try:
+        size = _filesize(path)
+    except OSError:
+        size = 0
+    return (-size, os.path.dirname(path))
+
+# Opens a folder in the platform's file manager, returning whether the launch
+# worked. Picked once at import; each launch returns immediately, so the GUI
+# thread never waits on a child process.
+if sys.platform == "win32":
+    def _open_folder(path):
+        return QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+elif sys.platform == "darwin":
+    def _open_folder(path):
+        return QProcess.startDetached("open", [path])
+else:  # Linux and other Unix desktops
+    def _open_folder(path):
+        return QProcess.startDetached("xdg-open", [path])
+
+# Where Tesseract is usually installed on Windows, including the per-user location
+TESSERACT_WINDOWS_PATHS = [
+    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+]
+if os.getenv('USERNAME'):
+    TESSERACT_WINDOWS_PATHS.append(
+        rf"C:\Users\{os.getenv('USERNAME')}\AppData\Local\Tesseract-OCR\tesseract.exe"
+    )
+
+@lru_cache(maxsize=1)
+def _find_tesseract_path():
+    """Return the first existing Tesseract install location, probing the disk only once"""
+    for path in TESSERACT_WINDOWS_PATHS:
+        if os.path.exists(path):
+            return path
+    
+    # If not found, return None and let user specify later
+    return None
+
 class ConversionWorker(QThread):
     """Worker thread for file conversions"""
-    progress_update = pyqtSignal(int)
     status_update = pyqtSignal(str)
-    file_completed = pyqtSignal(str, bool, str)  # filename, success, message
+    files_completed = pyqtSignal(list)  # [(filename, success, message), ...]
     conversion_finished = pyqtSignal(bool, str)  # success, output_folder
     
     def __init__(self, files_to_convert, output_folder, tesseract_path=None, enable_ai=True):
@@ -53,6 +283,11 @@ class ConversionWorker(QThread):
         self.tesseract_path = tesseract_path
         self.enable_ai = enable_ai
         self.should_stop = False
+        self._vision_lock = threading.Lock()  # Serializes image conversions in fallback mode
+        self._vision_processor = None  # Created on the first image, then reused
+        self.progress = 0  # Latest overall percentage; the window polls it
+        self._last_stage = None  # Stage of the last batch progress callback
+        self._last_emit = 0.0  # time.monotonic() of the last progress/status update
     
     def run(self):
         """Run the conversion process"""
@@ -66,39 +301,41 @@ class ConversionWorker(QThread):
             if BATCH_PROCESSOR_AVAILABLE and CONVERTER_AVAILABLE:
                 self.status_update.emit(f"CONVERTING {len(self.files_to_convert)} FILES...")
                 
-                # Initialize converter with AI setting
-                converter = DocumentConverter(self.tesseract_path, enable_ai=self.enable_ai)
+                # Converter settings with AI setting. The batch processor builds the
+                # converter itself: in each worker process when running in
+                # parallel, so the parent never loads a copy of the models it
+                # wouldn't use
+                converter = ConverterConfig(DocumentConverter, self.tesseract_path, self.enable_ai)
                 
-                # Initialize batch processor
-                batch_processor = BatchProcessor()
+                # Initialize batch processor, converting files in parallel worker
+                # processes while leaving a couple of cores for the GUI. Workers are
+                # spawned: forking would copy the GUI's threads' locks into them.
+                batch_processor = BatchProcessor(
+                    max_workers=self.batch_worker_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
                 
                 # Define progress callback for batch processor
                 def progress_callback(current, total, current_file, stage="converting"):
+                    if self.should_stop:
+                        return
+                    
                     # Calculate more granular progress based on stage
                     base_progress = ((current - 1) / total) * 100
-                    stage_progress = 0
-                    
-                    if stage == "starting":
-                        stage_progress = 0
-                        status_msg = f"STARTING {current}/{total}: {os.path.basename(current_file)}"
-                    elif stage == "converting": 
-                        stage_progress = 25  # 25% into current file
-                        status_msg = f"PROCESSING {current}/{total}: {os.path.basename(current_file)}"
-                    elif stage == "completed":
+                    label, stage_progress = _STAGE_TABLE.get(stage, _STAGE_DEFAULT)
+                    if stage_progress is None:
                         stage_progress = 100 / total  # Full file progress
-                        status_msg = f"COMPLETED {current}/{total}: {os.path.basename(current_file)}"
-                    elif stage == "failed":
-                        stage_progress = 100 / total
-                        status_msg = f"FAILED {current}/{total}: {os.path.basename(current_file)}"
-                    else:
-                        stage_progress = 50
-                        status_msg = f"PROCESSING {current}/{total}: {os.path.basename(current_file)}"
                     
                     progress = int(base_progress + stage_progress)
                     progress = min(progress, 100)  # Cap at 100%
                     
-                    self.progress_update.emit(progress)
-                    self.status_update.emit(status_msg)
+                    # Nothing new to show: same percentage, same stage
+                    if progress == self.progress and stage == self._last_stage:
+                        return
+                    self._last_stage = stage
+                    
+                    status_msg = f"{label} {current}/{total}: {_basename(current_file)}"
+                    self.report_progress(progress, status_msg)
                 
                 # Process the batch
                 result = batch_processor.process_batch(
@@ -109,21 +346,18 @@ class ConversionWorker(QThread):
                 )
                 
                 # Report results
-                self.progress_update.emit(100)
+                self.progress = 100
                 
                 if result.successful_files:
                     success_msg = f"CONVERSION COMPLETE! {len(result.successful_files)}/{result.total_files} FILES CONVERTED"
                     self.status_update.emit(success_msg)
                     
-                    # Emit file completed signals
-                    for file_path in result.successful_files:
-                        filename = os.path.basename(file_path)
-                        self.file_completed.emit(filename, True, "CONVERSION SUCCESSFUL")
-                    
-                    # Emit signals for failed files
-                    for file_path, error in result.failed_files:
-                        filename = os.path.basename(file_path)
-                        self.file_completed.emit(filename, False, error)
+                    # Report every file's outcome in one signal
+                    completions = [(_basename(file_path), True, "CONVERSION SUCCESSFUL")
+                                   for file_path in result.successful_files]
+                    completions.extend((_basename(file_path), False, error)
+                                       for file_path, error in result.failed_files)
+                    self.files_completed.emit(completions)
                     
                     self.conversion_finished.emit(True, self.output_folder)
                 else:
@@ -136,46 +370,55 @@ class ConversionWorker(QThread):
                 
                 successful_conversions = 0
                 total_files = len(self.files_to_convert)
+                completions = []  # Outcomes not yet sent to the GUI
+                last_flush = time.monotonic()
                 
-                for i, file_path in enumerate(self.files_to_convert):
-                    if self.should_stop:
-                        break
+                # Start the largest files first so one big file doesn't hold up the
+                # end of the batch; files of equal size stay grouped by folder
+                ordered = sorted(self.files_to_convert, key=_largest_first_key)
+                # Name parsing happens once here rather than inside every task
+                metas = [_file_meta(file_path) for file_path in ordered]
+                output_files = _reserve_output_paths(metas, self.output_folder)
+                
+                # Each file is independent and mostly file I/O, which releases the GIL.
+                # Images take turns on the shared vision processor, so they get a
+                # small pool of their own instead of tying up the I/O threads.
+                max_workers = min(32, (os.cpu_count() or 4) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as io_pool, \
+                        ThreadPoolExecutor(max_workers=IMAGE_POOL_WORKERS) as image_pool:
+                    futures = [
+                        (image_pool if meta[1] in IMAGE_EXTENSIONS else io_pool)
+                        .submit(self.convert_one_file, meta, output_file)
+                        for meta, output_file in zip(metas, output_files)
+                    ]
                     
-                    try:
-                        # Update progress with more detail
-                        filename = os.path.basename(file_path)
-                        
-                        # Starting file
-                        progress = int((i / total_files) * 100)
-                        self.progress_update.emit(progress)
-                        self.status_update.emit(f"STARTING {i+1}/{total_files}: {filename}")
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        if self.should_stop:
+                            for pending in futures:
+                                pending.cancel()
+                            break
                         
-                        # Processing file
-                        progress = int((i / total_files) * 100 + 25)  # Add 25% for processing
-                        progress = min(progress, 100)
-                        self.progress_update.emit(progress)
-                        self.status_update.emit(f"PROCESSING {i+1}/{total_files}: {filename}")
+                        filename, success, message = future.result()
                         
-                        # Basic conversion - create markdown file
-                        base_name = os.path.splitext(filename)[0]
-                        output_file = os.path.join(self.output_folder, f"{base_name}.md")
+                        progress = int((completed / total_files) * 100)
+                        self.report_progress(progress, f"COMPLETED {completed}/{total_files}: {filename}")
                         
-                        # Simple text extraction
-                        self.simple_convert_file(file_path, output_file)
+                        if success:
+                            successful_conversions += 1
                         
-                        # Completion progress
-                        progress = int(((i + 1) / total_files) * 100)
-                        self.progress_update.emit(progress)
-                        self.status_update.emit(f"COMPLETED {i+1}/{total_files}: {filename}")
-                        
-                        successful_conversions += 1
-                        self.file_completed.emit(filename, True, "BASIC CONVERSION SUCCESSFUL")
-                        
-                    except Exception as e:
-                        self.file_completed.emit(filename, False, str(e))
+                        # Outcomes go to the GUI in batches rather than one signal each
+                        completions.append((filename, success, message))
+                        now = time.monotonic()
+                        if now - last_flush >= COMPLETION_FLUSH_INTERVAL:
+                            self.files_completed.emit(completions)
+                            completions = []
+                            last_flush = now
+                
+                if completions:
+                    self.files_completed.emit(completions)
                 
                 # Final progress update
-                self.progress_update.emit(100)
+                self.progress = 100
                 
                 if successful_conversions > 0:
                     self.status_update.emit(f"CONVERSION COMPLETE! {successful_conversions}/{total_files} FILES CONVERTED")
@@ -190,104 +433,234 @@ class ConversionWorker(QThread):
             traceback.print_exc()
             self.conversion_finished.emit(False, "")
     
-    def simple_convert_file(self, input_file, output_file):
+    def report_progress(self, progress, status_msg):
+        """Publish progress for the window to poll, and send the status message at
+        most once per PROGRESS_MIN_INTERVAL"""
+        self.progress = progress
+        
+        now = time.monotonic()
+        if now - self._last_emit < PROGRESS_MIN_INTERVAL:
+            return
+        self._last_emit = now
+        self.status_update.emit(status_msg)
+    
+    def batch_worker_count(self):
+        """Number of worker processes for the batch converter"""
+        workers = max(2, QThread.idealThreadCount() - 2)
+        if self.enable_ai:
+            # Every worker process loads its own copy of the vision models
+            workers = min(workers, AI_BATCH_MAX_WORKERS)
+        return min(workers, len(self.files_to_convert))
+    
+    def get_vision_processor(self):
+        """Return the worker's AIVisionProcessor, loading its models on first use"""
+        if self._vision_processor is None:
+            # Imported here so torch is only loaded once an image actually needs it
+            from ai_vision_processor import AIVisionProcessor
+            self._vision_processor = AIVisionProcessor(enable_ai=self.enable_ai)
+        return self._vision_processor
+    
+    def convert_one_file(self, meta, output_file):
+        """Convert one file in fallback mode; returns (filename, success, message)
+        
+        Args:
+            meta: (path, lowercase extension, filename, stem) from _file_meta
+            output_file: Markdown path reserved for it by _reserve_output_paths
+        """
+        filename = meta[2]
+        try:
+            # Basic conversion - simple text extraction
+            self.simple_convert_file(meta, output_file)
+            return filename, True, "BASIC CONVERSION SUCCESSFUL"
+        except Exception as e:
+            return filename, False, str(e)
+    
+    def simple_convert_file(self, meta, output_file):
         """Simple file conversion for fallback mode"""
+        input_file, file_ext, filename, title = meta
         try:
-            # Get file extension
-            file_ext = os.path.splitext(input_file)[1].lower()
-            filename = os.path.basename(input_file)
+            # Build the whole document in memory and write it with a single call,
+            # starting with the YAML frontmatter
+            parts = [_FM_TMPL.format_map({'title': title, 'src': input_file})]
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Write YAML frontmatter
-                f.write("---\n")
-                f.write(f'title: "{os.path.splitext(filename)[0]}"\n')
-                f.write(f'source: "{input_file}"\n')
-                f.write('converter: "Markdown Magic"\n')
-                f.write("---\n\n")
-                
-                f.write(f"# {os.path.splitext(filename)[0]}\n\n")
-                
-                if file_ext == '.txt':
-                    # For TXT files, copy content directly
-                    try:
-                        with open(input_file, 'r', encoding='utf-8') as txt_file:
-                            content = txt_file.read()
-                            f.write(content)
-                    except:
-                        f.write("*Could not read text file content*\n")
-                
-                elif file_ext in ['.html', '.htm']:
-                    # Basic HTML to text conversion
-                    try:
-                        with open(input_file, 'r', encoding='utf-8') as html_file:
-                            content = html_file.read()
-                            # Very basic HTML tag removal
-                            import re
-                            text_content = re.sub(r'<[^>]+>', '', content)
-                            text_content = re.sub(r'\s+', ' ', text_content).strip()
-                            f.write(text_content)
-                    except:
-                        f.write("*Could not read HTML file content*\n")
-                
-                elif file_ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif']:
-                    # Handle image files with AI processing
-                    try:
-                        from ai_vision_processor import AIVisionProcessor
-                        processor = AIVisionProcessor(enable_ai=True)
-                        # Process the image file directly, overwriting our basic output
-                        result = processor.process_image_file(input_file, output_file)
-                        return  # Skip the rest since AI processor handled everything
-                    except ImportError:
-                        f.write(f"*Image file: {filename}*\n\n")
-                        f.write(f"![{filename}]({input_file})\n\n")
-                        f.write("Note: For AI-powered image descriptions and OCR, install AI dependencies:\n")
-                        f.write("```\npip3 install transformers torch\n```\n\n")
-                    except Exception as e:
-                        f.write(f"*Image processing failed: {e}*\n\n")
-                        f.write(f"![{filename}]({input_file})\n\n")
+            if file_ext == '.txt':
+                # For TXT files, copy content directly
+                try:
+                    parts.append(_read_text(input_file))
+                except:
+                    parts.append("*Could not read text file content*\n")
+            
+            elif file_ext in ['.html', '.htm']:
+                # Basic HTML to text conversion
+                try:
+                    # Very basic HTML tag removal
+                    content = _read_text(input_file)
+                    parts.append(_TAG_WS_RE.sub(_tag_ws_replacement, content).strip())
+                except:
+                    parts.append("*Could not read HTML file content*\n")
+            
+            elif file_ext in IMAGE_EXTENSIONS:
+                # Handle image files with AI processing, one at a time on the
+                # worker's shared processor. The file is read before taking the
+                # lock, so other pool threads load the next images while the
+                # model is busy with this one.
+                try:
+                    image_bytes = _read_source(input_file)
+                    with self._vision_lock:
+                        processor = self.get_vision_processor()
+                        # The AI processor writes the output file itself
+                        result = processor.process_image_file(input_file, output_file,
+                                                              image_bytes=image_bytes)
+                    return  # Skip the rest since AI processor handled everything
+                except ImportError:
+                    parts.append(f"*Image file: {filename}*\n\n")
+                    parts.append(f"![{filename}]({input_file})\n\n")
+                    parts.append("Note: For AI-powered image descriptions and OCR, install AI dependencies:\n")
+                    parts.append("```\npip3 install transformers torch\n```\n\n")
+                except Exception as e:
+                    parts.append(f"*Image processing failed: {e}*\n\n")
+                    parts.append(f"![{filename}]({input_file})\n\n")
+            
+            else:
+                # For other file types, create a placeholder
+                parts.append(f"*File converted from {file_ext.upper()} format*\n\n")
+                parts.append("Note: This is a basic conversion. For full functionality with advanced processing, ")
+                parts.append("please ensure all converter modules are installed.\n\n")
                 
-                else:
-                    # For other file types, create a placeholder
-                    f.write(f"*File converted from {file_ext.upper()} format*\n\n")
-                    f.write("Note: This is a basic conversion. For full functionality with advanced processing, ")
-                    f.write("please ensure all converter modules are installed.\n\n")
-                    
-                    try:
-                        file_size = os.path.getsize(input_file)
-                        f.write(f"Original file size: {file_size} bytes\n")
-                    except:
-                        pass
+                try:
+                    file_size = os.path.getsize(input_file)
+                    parts.append(f"Original file size: {file_size} bytes\n")
+                except:
+                    pass
+            
+            # Text mode, so the output uses the platform's line endings
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
                         
         except Exception as e:
             # If conversion fails, create error file
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("---\n")
-                f.write(f'title: "Conversion Error - {os.path.basename(input_file)}"\n')
-                f.write('converter: "Markdown Magic"\n')
-                f.write("---\n\n")
-                f.write(f"# Conversion Error\n\n")
-                f.write(f"Could not convert file: {input_file}\n")
-                f.write(f"Error: {str(e)}\n")
+                f.write(_ERR_TMPL.format_map({
+                    'name': filename,
+                    'src': input_file,
+                    'error': str(e),
+                }))
     
     def stop(self):
         """Stop the conversion process"""
         self.should_stop = True
 
-class DragDropFileList(QListWidget):
+class FileListModel(QAbstractListModel):
+    """Paths of the files queued for conversion, with their display strings
+    
+    Rows are kept as two parallel lists rather than one item object per row,
+    so large drops cost a couple of list appends per file.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []  # Row -> file path
+        self._display = []  # Row -> "name (size)"
+        self._sizes = []  # Row -> size in bytes, or None if it couldn't be read
+        self._known = set()  # Fast membership test for _paths
+        self._total_size = 0  # Sum of the known sizes, kept up to date on add/remove
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._display[row]
+        if role in (Qt.UserRole, Qt.ToolTipRole):
+            return self._paths[row]
+        return None
+    
+    def add_paths(self, file_paths):
+        """Append the paths not already in the model; returns how many were added"""
+        new_paths = []
+        for file_path in file_paths:
+            if file_path not in self._known:
+                self._known.add(file_path)
+                new_paths.append(file_path)
+        if not new_paths:
+            return 0
+        
+        # Each file is stat'ed once, here, for both its label and the total
+        sizes = _filesizes(new_paths)
+        
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+        for file_path, size in zip(new_paths, sizes):
+            if size is not None:
+                self._total_size += size
+            self._paths.append(file_path)
+            self._sizes.append(size)
+            self._display.append(_display_name(file_path, size))
+        self.endInsertRows()
+        return len(new_paths)
+    
+    def remove_row(self, row):
+        """Remove the file at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._known.discard(self._paths.pop(row))
+        del self._display[row]
+        size = self._sizes.pop(row)
+        if size is not None:
+            self._total_size -= size
+        self.endRemoveRows()
+    
+    def clear(self):
+        """Remove every file"""
+        self.beginResetModel()
+        self._paths.clear()
+        self._display.clear()
+        self._sizes.clear()
+        self._known.clear()
+        self._total_size = 0
+        self.endResetModel()
+    
+    def contains(self, file_path):
+        return file_path in self._known
+    
+    def paths(self):
+        return list(self._paths)
+    
+    def total_size(self):
+        """Combined size in bytes of the files whose size could be read"""
+        return self._total_size
+
+
+def _display_name(file_path, size):
+    """Text shown for a file in the list: its name and size"""
+    size_str = "???B" if size is None else _format_size(size)
+    return f"{_basename(file_path)} ({size_str})"
+
+
+class DragDropFileList(QListView):
     """File list with drag and drop support"""
     
     files_dropped = pyqtSignal(list)
     file_removed = pyqtSignal()
     
+    PLACEHOLDER_TEXT = "Drop files here or use the Add Files button"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DropOnly)
+        self.setDragDropMode(QListView.DropOnly)
         self.setFont(QFont("Courier New", 11))
-        self.add_placeholder()
+        self.setUniformItemSizes(True)  # Lets the view skip measuring every row
+        self._placeholder_font = QFont("Courier New", 11)
+        self._placeholder_font.setItalic(True)
+        
+        self._model = FileListModel(self)
+        self.setModel(self._model)
         
         # Set selection mode to allow single selection
-        self.setSelectionMode(QListWidget.SingleSelection)
+        self.setSelectionMode(QListView.SingleSelection)
         
         # Enable context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -307,99 +680,83 @@ class DragDropFileList(QListWidget):
             file_path = url.toLocalFile()
             if os.path.isfile(file_path):
                 files.append(file_path)
+            elif os.path.isdir(file_path):
+                # A dropped folder adds the files directly inside it
+                files.extend(_scan_folder(file_path))
         
         if files:
             self.files_dropped.emit(files)
             event.acceptProposedAction()
     
-    def add_placeholder(self):
-        if self.count() == 0:
-            item = QListWidgetItem("Drop files here or use the Add Files button")
-            item.setFlags(Qt.NoItemFlags)
-            item.setData(Qt.UserRole, None)
-            font = QFont("Courier New", 11)
-            font.setItalic(True)
-            item.setFont(font)
-            self.addItem(item)
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        
+        # Empty-state hint, drawn over the viewport instead of stored as a row
+        if not self.has_files():
+            painter = QPainter(self.viewport())
+            painter.setFont(self._placeholder_font)
+            painter.setPen(self.palette().color(QPalette.Text))
+            painter.drawText(self.viewport().rect().adjusted(5, 5, -5, -5),
+                             Qt.AlignLeft | Qt.AlignTop, self.PLACEHOLDER_TEXT)
+            painter.end()
     
     def add_file_item(self, file_path):
-        # Remove placeholder
-        if self.count() > 0:
-            first_item = self.item(0)
-            if first_item and first_item.data(Qt.UserRole) is None:
-                self.takeItem(0)
-        
-        filename = os.path.basename(file_path)
-        try:
-            size = os.path.getsize(file_path)
-            if size < 1024:
-                size_str = f"{size}B"
-            elif size < 1024 * 1024:
-                size_str = f"{size/1024:.1f}KB"
-            else:
-                size_str = f"{size/(1024*1024):.1f}MB"
-        except:
-            size_str = "???B"
-        
-        item = QListWidgetItem(f"{filename} ({size_str})")
-        item.setToolTip(file_path)
-        item.setData(Qt.UserRole, file_path)
-        item.setFont(QFont("Courier New", 11))
-        self.addItem(item)
+        self._model.add_paths([file_path])
+    
+    def add_file_items(self, file_paths):
+        """Add several files in one model insert; returns how many were new"""
+        return self._model.add_paths(file_paths)
+    
+    def contains(self, file_path):
+        """Whether file_path is already in the list"""
+        return self._model.contains(file_path)
     
     def get_all_file_paths(self):
-        files = []
-        for i in range(self.count()):
-            item = self.item(i)
-            if item and item.data(Qt.UserRole):
-                files.append(item.data(Qt.UserRole))
-        return files
+        return self._model.paths()
     
     def clear_all_files(self):
-        self.clear()
-        self.add_placeholder()
+        self._model.clear()
+        _basename.cache_clear()
+        _size_cache.clear()
     
     def has_files(self):
-        for i in range(self.count()):
-            item = self.item(i)
-            if item and item.data(Qt.UserRole):
-                return True
-        return False
+        return self._model.rowCount() > 0
+    
+    def file_count(self):
+        return self._model.rowCount()
+    
+    def total_size(self):
+        return self._model.total_size()
     
     def show_context_menu(self, position):
         """Show context menu for file operations"""
-        item = self.itemAt(position)
-        if item and item.data(Qt.UserRole):  # Only show menu for actual files
+        index = self.indexAt(position)
+        if index.isValid():  # Only show menu for actual files
             from PyQt5.QtWidgets import QMenu, QAction
             
             menu = QMenu(self)
             
             # Remove file action
             remove_action = QAction("Remove File", self)
-            remove_action.triggered.connect(lambda: self.remove_file(item))
+            remove_action.triggered.connect(lambda: self.remove_file(index.row()))
             menu.addAction(remove_action)
             
             # Show menu at cursor position
             menu.exec_(self.mapToGlobal(position))
     
-    def remove_file(self, item):
-        """Remove a specific file from the list"""
-        if item and item.data(Qt.UserRole):
-            row = self.row(item)
-            self.takeItem(row)
-            
-            # If no files left, add placeholder
-            if not self.has_files():
-                self.add_placeholder()
+    def remove_file(self, row):
+        """Remove the file at row from the list"""
+        if 0 <= row < self._model.rowCount():
+            self._model.remove_row(row)
             
             # Emit signal to update parent
             self.file_removed.emit()
     
     def remove_selected_file(self):
         """Remove the currently selected file"""
-        current_item = self.currentItem()
-        if current_item and current_item.data(Qt.UserRole):
-            self.remove_file(current_item)
+        current = self.currentIndex()
+        if current.isValid():
+            self.remove_file(current.row())
     
     def keyPressEvent(self, event):
         """Handle keyboard events"""
@@ -411,6 +768,218 @@ class DragDropFileList(QListWidget):
         else:
             super().keyPressEvent(event)
 
+# CRT hacker green theme, minified once at import
+CRT_STYLESHEET = _minify_qss("""
+/* Main window background */
+QMainWindow {
+    background-color: #000000;
+    color: #00ff00;
+}
+
+/* Title styling */
+QLabel#title {
+    color: #00ff00;
+    background-color: #000000;
+    border: 2px solid #00ff00;
+    padding: 10px;
+    text-align: center;
+}
+
+/* Subtitle styling */
+QLabel#subtitle {
+    color: #00ff00;
+    background-color: #000000;
+}
+
+/* Info labels */
+QLabel#info_label {
+    color: #00ff00;
+    background-color: #000000;
+}
+
+/* Buttons */
+QPushButton#crt_button {
+    background-color: #000000;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+    padding: 10px 20px;
+    font-family: "Courier New";
+    font-size: 12px;
+    font-weight: bold;
+    min-height: 20px;
+}
+
+QPushButton#crt_button:hover {
+    background-color: #001100;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+}
+
+QPushButton#crt_button:pressed {
+    background-color: #00ff00;
+    color: #000000;
+    border: 2px solid #00ff00;
+}
+
+QPushButton#crt_button:disabled {
+    background-color: #000000;
+    color: #003300;
+    border: 2px solid #003300; 
+}
+
+/* Convert button (special highlight) */
+QPushButton#convert_button {
+    background-color: #000000;
+    color: #00ff00;
+    border: 3px solid #00ff00;
+    padding: 10px 20px;
+    font-family: "Courier New";
+    font-size: 14px;
+    font-weight: bold;
+    min-height: 25px;
+}
+
+QPushButton#convert_button:hover {
+    background-color: #002200;
+    color: #00ff00;
+    border: 3px solid #00ff00;
+}
+
+QPushButton#convert_button:pressed {
+    background-color: #00ff00;
+    color: #000000;
+    border: 3px solid #00ff00;
+}
+
+QPushButton#convert_button:disabled {
+    background-color: #000000;
+    color: #003300;
+    border: 3px solid #003300;
+}
+
+/* Drag and drop area */
+QListView#drag_drop_area {
+    background-color: #000000;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+    font-family: "Courier New";
+    font-size: 11px;
+    selection-background-color: #004400;
+    selection-color: #00ff00;
+}
+
+QListView#drag_drop_area::item {
+    padding: 5px;
+    border-bottom: 1px solid #003300;
+}
+
+QListView#drag_drop_area::item:selected {
+    background-color: #004400;
+    color: #00ff00;
+}
+
+QListView#drag_drop_area::item:hover {
+    background-color: #002200;
+    color: #00ff00;
+}
+
+/* Progress bar */
+QProgressBar#progress_bar {
+    background-color: #000000;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+    text-align: center;
+    font-family: "Courier New";
+    font-size: 11px;
+    font-weight: bold;
+}
+
+QProgressBar#progress_bar::chunk {
+    background-color: #00ff00;
+}
+
+/* Status bar */
+QStatusBar {
+    background-color: #000000;
+    color: #00ff00;
+    border-top: 1px solid #00ff00;
+}
+
+/* AI Vision Checkbox */
+QCheckBox#ai_checkbox {
+    background-color: #000000;
+    color: #00ff00;
+    font-family: "Courier New";
+    font-size: 11px;
+    spacing: 5px;
+}
+
+QCheckBox#ai_checkbox::indicator {
+    width: 18px;
+    height: 18px;
+    border: 2px solid #00ff00;
+    background-color: #000000;
+}
+
+QCheckBox#ai_checkbox::indicator:checked {
+    background-color: #00ff00;
+    border: 2px solid #00ff00;
+}
+
+QCheckBox#ai_checkbox::indicator:hover {
+    border: 2px solid #00ff88;
+}
+
+/* Central widget */
+QWidget {
+    background-color: #000000;
+    color: #00ff00;
+    font-family: "Courier New";
+}
+""")
+
+# Message boxes in the CRT theme: the output folder prompt, and the larger
+# conversion-complete dialog
+MSGBOX_STYLESHEET = _minify_qss("""
+QMessageBox {
+    background-color: #000000;
+    color: #00ff00;
+    font-family: "Courier New";
+}
+QMessageBox QPushButton {
+    background-color: #000000;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+    padding: 5px 15px;
+    font-family: "Courier New";
+    font-weight: bold;
+}
+QMessageBox QPushButton:hover {
+    background-color: #001100;
+}
+""")
+
+COMPLETION_MSGBOX_STYLESHEET = _minify_qss("""
+QMessageBox {
+    background-color: #000000;
+    color: #00ff00;
+    font-family: "Courier New";
+    font-size: 12px;
+}
+QMessageBox QPushButton {
+    background-color: #000000;
+    color: #00ff00;
+    border: 2px solid #00ff00;
+    padding: 8px 20px;
+    font-family: "Courier New";
+    font-weight: bold;
+    font-size: 11px;
+}
+QMessageBox QPushButton:hover {
+    background-color: #001100;
+}
+""")
+
 class MarkdownMagicWindow(QMainWindow):
     """Main application window with CRT theme"""
     
@@ -425,25 +994,15 @@ class MarkdownMagicWindow(QMainWindow):
         self.init_ui()
         self.apply_crt_theme()
         
+        # The progress bar pulls the worker's percentage on a timer instead of
+        # repainting for every update the worker makes
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(int(PROGRESS_MIN_INTERVAL * 1000))
+        self.progress_timer.timeout.connect(self.poll_progress)
+        
     def find_tesseract_path(self):
         """Find Tesseract installation on Windows"""
-        possible_paths = [
-            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-        ]
-        
-        # Check user-specific installation
-        username = os.getenv('USERNAME', '')
-        if username:
-            user_path = rf"C:\Users\{username}\AppData\Local\Tesseract-OCR\tesseract.exe"
-            possible_paths.append(user_path)
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        # If not found, return None and let user specify later
-        return None
+        return _find_tesseract_path()
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -483,6 +1042,11 @@ class MarkdownMagicWindow(QMainWindow):
         self.ai_vision_checkbox.setChecked(True)  # Default enabled
         self.ai_vision_checkbox.setFont(QFont("Courier New", 10))
         self.ai_vision_checkbox.setObjectName("ai_checkbox")
+        if not AI_VISION_AVAILABLE:
+            # Without transformers and torch the option would do nothing
+            self.ai_vision_checkbox.setChecked(False)
+            self.ai_vision_checkbox.setEnabled(False)
+            self.ai_vision_checkbox.setToolTip("Install AI dependencies to enable: pip3 install transformers torch")
         main_layout.addWidget(self.ai_vision_checkbox)
         
         # Spacing
@@ -557,174 +1121,7 @@ class MarkdownMagicWindow(QMainWindow):
         
     def apply_crt_theme(self):
         """Apply the CRT hacker green theme"""
-        self.setStyleSheet("""
-            /* Main window background */
-            QMainWindow {
-                background-color: #000000;
-                color: #00ff00;
-            }
-            
-            /* Title styling */
-            QLabel#title {
-                color: #00ff00;
-                background-color: #000000;
-                border: 2px solid #00ff00;
-                padding: 10px;
-                text-align: center;
-            }
-            
-            /* Subtitle styling */
-            QLabel#subtitle {
-                color: #00ff00;
-                background-color: #000000;
-            }
-            
-            /* Info labels */
-            QLabel#info_label {
-                color: #00ff00;
-                background-color: #000000;
-            }
-            
-            /* Buttons */
-            QPushButton#crt_button {
-                background-color: #000000;
-                color: #00ff00;
-                border: 2px solid #00ff00;
-                padding: 10px 20px;
-                font-family: "Courier New";
-                font-size: 12px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            
-            QPushButton#crt_button:hover {
-                background-color: #001100;
-                color: #00ff00;
-                border: 2px solid #00ff00;
-            }
-            
-            QPushButton#crt_button:pressed {
-                background-color: #00ff00;
-                color: #000000;
-                border: 2px solid #00ff00;
-            }
-            
-            QPushButton#crt_button:disabled {
-                background-color: #000000;
-                color: #003300;
-                border: 2px solid #003300; 
-            }
-            
-            /* Convert button (special highlight) */
-            QPushButton#convert_button {
-                background-color: #000000;
-                color: #00ff00;
-                border: 3px solid #00ff00;
-                padding: 10px 20px;
-                font-family: "Courier New";
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 25px;
-            }
-            
-            QPushButton#convert_button:hover {
-                background-color: #002200;
-                color: #00ff00;
-                border: 3px solid #00ff00;
-            }
-            
-            QPushButton#convert_button:pressed {
-                background-color: #00ff00;
-                color: #000000;
-                border: 3px solid #00ff00;
-            }
-            
-            QPushButton#convert_button:disabled {
-                background-color: #000000;
-                color: #003300;
-                border: 3px solid #003300;
-            }
-            
-            /* Drag and drop area */
-            QListWidget#drag_drop_area {
-                background-color: #000000;
-                color: #00ff00;
-                border: 2px solid #00ff00;
-                font-family: "Courier New";
-                font-size: 11px;
-                selection-background-color: #004400;
-                selection-color: #00ff00;
-            }
-            
-            QListWidget#drag_drop_area::item {
-                padding: 5px;
-                border-bottom: 1px solid #003300;
-            }
-            
-            QListWidget#drag_drop_area::item:selected {
-                background-color: #004400;
-                color: #00ff00;
-            }
-            
-            QListWidget#drag_drop_area::item:hover {
-                background-color: #002200;
-                color: #00ff00;
-            }
-            
-            /* Progress bar */
-            QProgressBar#progress_bar {
-                background-color: #000000;
-                color: #00ff00;
-                border: 2px solid #00ff00;
-                text-align: center;
-                font-family: "Courier New";
-                font-size: 11px;
-                font-weight: bold;
-            }
-            
-            QProgressBar#progress_bar::chunk {
-                background-color: #00ff00;
-            }
-            
-            /* Status bar */
-            QStatusBar {
-                background-color: #000000;
-                color: #00ff00;
-                border-top: 1px solid #00ff00;
-            }
-            
-            /* AI Vision Checkbox */
-            QCheckBox#ai_checkbox {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: "Courier New";
-                font-size: 11px;
-                spacing: 5px;
-            }
-            
-            QCheckBox#ai_checkbox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #00ff00;
-                background-color: #000000;
-            }
-            
-            QCheckBox#ai_checkbox::indicator:checked {
-                background-color: #00ff00;
-                border: 2px solid #00ff00;
-            }
-            
-            QCheckBox#ai_checkbox::indicator:hover {
-                border: 2px solid #00ff88;
-            }
-            
-            /* Central widget */
-            QWidget {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: "Courier New";
-            }
-        """)
+        self.setStyleSheet(CRT_STYLESHEET)
     
     def add_files(self):
         """Open file dialog to add files"""
@@ -740,13 +1137,7 @@ class MarkdownMagicWindow(QMainWindow):
     
     def add_files_to_list(self, files):
         """Add files to the conversion list"""
-        added_count = 0
-        current_files = self.file_list.get_all_file_paths()
-        
-        for file_path in files:
-            if file_path not in current_files:
-                self.file_list.add_file_item(file_path)
-                added_count += 1
+        added_count = self.file_list.add_file_items(files)
         
         if added_count > 0:
             self.update_file_info()
@@ -768,52 +1159,30 @@ class MarkdownMagicWindow(QMainWindow):
     
     def update_file_info(self):
         """Update file information display"""
-        file_paths = self.file_list.get_all_file_paths()
-        count = len(file_paths)
+        count = self.file_list.file_count()
         
         if count == 0:
-            self.file_info_label.setText("No files selected")
-            self.clear_files_btn.setEnabled(False)
+            info = "No files selected"
         else:
-            # Calculate total size
-            total_size = 0
-            for file_path in file_paths:
-                try:
-                    total_size += os.path.getsize(file_path)
-                except OSError:
-                    pass
-            
-            size_mb = total_size / (1024 * 1024)
-            self.file_info_label.setText(f"{count} file(s) selected, {size_mb:.1f} MB total")
-            self.clear_files_btn.setEnabled(True)
+            # The list keeps a running total, so no file is stat'ed here
+            size_mb = self.file_list.total_size() / (1024 * 1024)
+            info = f"{count} file(s) selected, {size_mb:.1f} MB total"
             
             # Check size limit
             if size_mb > 250:
-                self.file_info_label.setText(f"{count} file(s) selected, {size_mb:.1f} MB total (EXCEEDS 250MB LIMIT)")
+                info += " (EXCEEDS 250MB LIMIT)"
+        
+        # Only touch the label when the text changes, sparing it a relayout
+        if info != self.file_info_label.text():
+            self.file_info_label.setText(info)
+        self.clear_files_btn.setEnabled(count > 0)
     
     def select_output_folder(self):
         """Select output folder with option to create new folder on desktop"""
         msg = QMessageBox()
         msg.setWindowTitle("Select Output Folder")
         msg.setText("Choose output folder option:")
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: "Courier New";
-            }
-            QMessageBox QPushButton {
-                background-color: #000000;
-                color: #00ff00;
-                border: 2px solid #00ff00;
-                padding: 5px 15px;
-                font-family: "Courier New";
-                font-weight: bold;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #001100;
-            }
-        """)
+        msg.setStyleSheet(MSGBOX_STYLESHEET)
         
         existing_btn = msg.addButton("Browse Existing Folder", QMessageBox.ActionRole)
         desktop_btn = msg.addButton("Create New Folder on Desktop", QMessageBox.ActionRole)
@@ -834,13 +1203,14 @@ class MarkdownMagicWindow(QMainWindow):
             folder_name = "Markdown_Magic_Conversions"
             new_folder_path = os.path.join(desktop_path, folder_name)
             
-            counter = 1
-            while os.path.exists(new_folder_path):
-                new_folder_path = os.path.join(desktop_path, f"{folder_name}_{counter}")
-                counter += 1
-            
             try:
-                os.makedirs(new_folder_path)
+                # Let mkdir itself report a taken name, rather than checking first
+                for counter in itertools.count(1):
+                    try:
+                        os.makedirs(new_folder_path)
+                        break
+                    except FileExistsError:
+                        new_folder_path = os.path.join(desktop_path, f"{folder_name}_{counter}")
                 self.output_folder = new_folder_path
                 self.output_folder_label.setText(f"Output: {new_folder_path}")
                 self.update_convert_button_state()
@@ -874,8 +1244,12 @@ class MarkdownMagicWindow(QMainWindow):
         
         self.status_bar.showMessage("STARTING CONVERSION...")
         
-        # Start worker thread
-        ai_enabled = self.ai_vision_checkbox.isChecked()
+        # Start worker thread. The vision models take seconds and gigabytes to
+        # load, so they are only enabled when some file can contain images.
+        ai_enabled = self.ai_vision_checkbox.isChecked() and any(
+            os.path.splitext(file_path)[1].lower() in IMAGE_BEARING_EXTENSIONS
+            for file_path in file_paths
+        )
         self.conversion_worker = ConversionWorker(
             file_paths, 
             self.output_folder,
@@ -884,16 +1258,21 @@ class MarkdownMagicWindow(QMainWindow):
         )
         
         # Connect signals
-        self.conversion_worker.progress_update.connect(self.progress_bar.setValue)
         self.conversion_worker.status_update.connect(self.status_bar.showMessage)
-        self.conversion_worker.file_completed.connect(self.on_file_completed)
+        self.conversion_worker.files_completed.connect(self.on_files_completed)
         self.conversion_worker.conversion_finished.connect(self.on_conversion_finished)
         
         # Start the worker
         self.conversion_worker.start()
+        self.progress_timer.start()
+    
+    def poll_progress(self):
+        """Show the running conversion's latest progress"""
+        if self.conversion_worker:
+            self.progress_bar.setValue(self.conversion_worker.progress)
     
-    def on_file_completed(self, filename, success, message):
-        """Handle individual file completion"""
+    def on_files_completed(self, completions):
+        """Handle a batch of (filename, success, message) file completions"""
         # Could enhance with a conversion log display
         pass
     
@@ -904,6 +1283,7 @@ class MarkdownMagicWindow(QMainWindow):
         self.add_files_btn.setEnabled(True)
         self.clear_files_btn.setEnabled(True)
         self.output_folder_btn.setEnabled(True)
+        self.progress_timer.stop()
         self.progress_bar.setVisible(False)
         
         # Clean up worker
@@ -917,47 +1297,32 @@ class MarkdownMagicWindow(QMainWindow):
         if success:
             self.status_bar.showMessage("CONVERSION COMPLETE")
             
-            # Show completion dialog
-            msg = QMessageBox()
+            # Show completion dialog window-modal with open() rather than exec_(),
+            # so this slot returns and the event loop keeps running while the
+            # user decides. The window parents it, which keeps it alive until closed.
+            msg = QMessageBox(self)
             msg.setWindowTitle("Conversion Complete")
             msg.setText("Conversion complete. Open Output Folder?")
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #000000;
-                    color: #00ff00;
-                    font-family: "Courier New";
-                    font-size: 12px;
-                }
-                QMessageBox QPushButton {
-                    background-color: #000000;
-                    color: #00ff00;
-                    border: 2px solid #00ff00;
-                    padding: 8px 20px;
-                    font-family: "Courier New";
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #001100;
-                }
-            """)
+            msg.setStyleSheet(COMPLETION_MSGBOX_STYLESHEET)
             msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             msg.setDefaultButton(QMessageBox.Yes)
-            
-            if msg.exec_() == QMessageBox.Yes and output_folder:
-                self.open_output_folder(output_folder)
+            msg.setAttribute(Qt.WA_DeleteOnClose)
+            msg.finished.connect(
+                lambda result: self.on_completion_prompt_finished(result, output_folder))
+            msg.open()
         else:
             self.status_bar.showMessage("CONVERSION FAILED")
     
+    def on_completion_prompt_finished(self, result, output_folder):
+        """Open the output folder if the user answered Yes to the completion prompt"""
+        if result == QMessageBox.Yes and output_folder:
+            self.open_output_folder(output_folder)
+    
     def open_output_folder(self, folder_path):
         """Open the output folder in file explorer"""
         try:
-            if platform.system() == "Windows":
-                os.startfile(folder_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(["open", folder_path])
-            else:  # Linux
-                subprocess.Popen(["xdg-open", folder_path])
+            if not _open_folder(folder_path):
+                raise OSError("no application is available to open it")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open folder: {str(e)}")
 
@@ -987,4 +1352,6 @@ def main():
     return app.exec_()
 
 if __name__ == "__main__":
+    # Batch conversions run in worker processes, which re-import the main module
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for recovering from a worker process that dies during a batch
+"""
+
+import os
+import multiprocessing
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from batch_processor import BatchProcessor, ConverterConfig, create_worker_pool
+
+class ExitingConverter:
+    """Converter that kills its worker process on files named crash.txt"""
+
+    def __init__(self, tesseract_path=None, enable_ai=True):
+        pass
+
+    def convert_to_markdown(self, input_file, output_file):
+        if os.path.basename(input_file) == 'crash.txt':
+            os._exit(1)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('converted\n')
+        return output_file
+
+def make_files(folder, names):
+    """Create small text files and return their paths"""
+    paths = []
+    for name in names:
+        path = os.path.join(folder, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('text\n')
+        paths.append(path)
+    return paths
+
+def test_shared_pool_recovers_after_worker_dies():
+    """A broken shared pool is raised, and a replacement pool converts the next batch"""
+    converter = ConverterConfig(ExitingConverter)
+    context = multiprocessing.get_context('spawn')
+    input_folder = tempfile.mkdtemp()
+    output_folder = tempfile.mkdtemp()
+
+    pool = create_worker_pool(1, converter, mp_context=context)
+    try:
+        crashing = make_files(input_folder, ['crash.txt', 'a.txt'])
+        try:
+            BatchProcessor(executor=pool).process_batch(crashing, output_folder, converter)
+        except BrokenProcessPool:
+            pass
+        else:
+            raise AssertionError("A dead worker should break the shared pool")
+    finally:
+        pool.shutdown(wait=False)
+
+    # What the owner of the shared pool does: start a new one for the next batch
+    pool = create_worker_pool(1, converter, mp_context=context)
+    try:
+        files = make_files(input_folder, ['b.txt', 'c.txt'])
+        result = BatchProcessor(executor=pool).process_batch(files, output_folder, converter)
+    finally:
+        pool.shutdown()
+
+    assert len(result.successful_files) == 2
+    assert not result.failed_files
+
+def test_own_pool_records_dead_worker_as_failure():
+    """A pool started for a single batch reports a dead worker as failed files"""
+    converter = ConverterConfig(ExitingConverter)
+    input_folder = tempfile.mkdtemp()
+    files = make_files(input_folder, ['crash.txt', 'a.txt'])
+
+    result = BatchProcessor(max_workers=2).process_batch(files, tempfile.mkdtemp(), converter)
+
+    assert os.path.join(input_folder, 'crash.txt') in [path for path, _ in result.failed_files]
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the GUI's fallback (basic) conversion
+"""
+
+import os
+import tempfile
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from markdown_magic_gui import ConversionWorker, _file_meta
+
+def test_fallback_txt_normalizes_crlf():
+    """CRLF and CR line endings in a text file become the platform's line endings"""
+    folder = tempfile.mkdtemp()
+    input_file = os.path.join(folder, 'notes.txt')
+    output_file = os.path.join(folder, 'notes.md')
+    with open(input_file, 'wb') as f:
+        f.write(b'first line\r\nsecond line\rthird line\r\n')
+
+    worker = ConversionWorker([input_file], folder, enable_ai=False)
+    worker.simple_convert_file(_file_meta(input_file), output_file)
+
+    # Read without newline translation to see the line endings as written
+    with open(output_file, encoding='utf-8', newline='') as f:
+        content = f.read()
+    lines = content.split(os.linesep)
+
+    assert all('\r' not in line for line in lines)
+    assert lines[-4:] == ['first line', 'second line', 'third line', '']